@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Start-up time check for the ISSE CLI.
+
+Runs CLI invocations in fresh interpreters under `python -X importtime` and
+fails if a command imports heavy dependencies it does not need, or if
+`--help` exceeds its wall-time budget. Cron- and container-driven runs start
+many short-lived processes, so every eager import is paid on each of them.
+"""
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MAIN_SCRIPT = PROJECT_ROOT / "scripts" / "main.py"
+
+HEAVY_MODULES = {
+    'numpy', 'pandas', 'pandera', 'sklearn', 'scipy', 'lifetimes', 'ortools', 'matplotlib',
+}
+
+# (CLI arguments, heavy modules the invocation is allowed to import)
+CASES: List[Tuple[List[str], Set[str]]] = [
+    (['--help'], set()),
+    (['run-financial-sim', '--help'], set()),
+    (['run-financial-sim'], {'numpy'}),
+    (['query-financial-emulator', '--help'], set()),
+]
+
+DEFAULT_HELP_BUDGET_S = 1.0
+DEFAULT_REPEATS = 5
+
+
+def imported_modules(args: List[str]) -> Set[str]:
+    """Returns the top-level packages imported by `main.py <args>`."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(MAIN_SCRIPT), *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"'main.py {' '.join(args)}' failed:\n{completed.stderr[-2000:]}")
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.rsplit('|', 1)[1].strip().split('.')[0])
+    return modules
+
+
+def help_wall_time(repeats: int = DEFAULT_REPEATS) -> float:
+    """Median wall time of `main.py --help` over `repeats` fresh processes."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(MAIN_SCRIPT), '--help'],
+            cwd=PROJECT_ROOT, capture_output=True, check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(help_budget_s: float = DEFAULT_HELP_BUDGET_S) -> List[str]:
+    """
+    Main function to run all start-up checks.
+
+    Returns:
+        A description of each failed check (empty if all passed).
+    """
+    failures = []
+    for args, allowed in CASES:
+        command = ' '.join(args)
+        unexpected = sorted((imported_modules(args) & HEAVY_MODULES) - allowed)
+        if unexpected:
+            failures.append(f"'{command}' imports heavy dependencies: {', '.join(unexpected)}")
+        else:
+            print(f"  OK   '{command}' imports no unneeded heavy dependencies")
+
+    elapsed = help_wall_time()
+    if elapsed > help_budget_s:
+        failures.append(f"'--help' took {elapsed:.3f}s (budget {help_budget_s:.3f}s)")
+    else:
+        print(f"  OK   '--help' took {elapsed:.3f}s (budget {help_budget_s:.3f}s)")
+
+    for failure in failures:
+        print(f"  FAIL {failure}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -4,35 +4,57 @@ Main entry point for the Ikiru Strategic Simulation Engine (ISSE).
 
 This script provides a command-line interface (CLI) to run all modules
 of the ISSE, from data processing to running the final financial simulation.
+
+Stage modules are imported inside each command rather than at the top of this
+file, so `--help` and lightweight commands such as `run-financial-sim` never
+pay for importing pandas, pandera, scikit-learn, lifetimes or OR-Tools.
+Keep it that way: `scripts/check_startup.py` enforces it.
 """
 import click
 import os
 
-# Dynamically add the src directory to the python path
+# Dynamically add the src and scripts directories to the python path
 import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from isse.scripts import (
-    process_data,
-    run_b2b_model,
-    run_d2c_ltv_model,
-    run_d2c_mmm_model,
-    run_financial_simulation,
-    run_logistics_model,
-)
 
 @click.group()
-def isse_cli():
+@click.option('--profile', is_flag=True,
+              help='Record per-stage timings, counters and peak memory for this run.')
+@click.option('--profile-dir', type=click.Path(file_okay=False), default='data/profiles',
+              show_default=True, help='Directory for the JSON trace and Prometheus metrics.')
+@click.option('--profiler', type=click.Choice(['cprofile', 'pyinstrument']), default=None,
+              help='Additionally dump a cProfile (.prof) or pyinstrument (.html) profile.')
+@click.pass_context
+def isse_cli(ctx, profile, profile_dir, profiler):
     """
     Ikiru Strategic Simulation Engine (ISSE)
     
     A command-line tool to run various strategic models and simulations.
     """
-    pass
+    if not profile:
+        return
+    from isse import instrumentation
+    prefix = ctx.invoked_subcommand or 'isse'
+    instrumentation.profiler.enable()
+    if profiler:
+        suffix = 'prof' if profiler == 'cprofile' else 'html'
+        ctx.with_resource(instrumentation.code_profiler(
+            os.path.join(profile_dir, f'{prefix}_profile.{suffix}'), backend=profiler
+        ))
+
+    def write_profile():
+        instrumentation.profiler.disable()
+        for kind, path in instrumentation.profiler.write(profile_dir, prefix).items():
+            click.echo(f"Profile {kind} written to {path}")
+
+    ctx.call_on_close(write_profile)
 
 @isse_cli.command()
 def process_data_pipeline():
     """Runs the full data processing and validation pipeline."""
+    import process_data
     click.echo("Starting data processing pipeline...")
     process_data.main()
     click.echo("Data processing pipeline finished successfully.")
@@ -40,6 +62,7 @@ def process_data_pipeline():
 @isse_cli.command()
 def run_ltv():
     """Runs the D2C Customer Lifetime Value (LTV) model."""
+    import run_ltv_model as run_d2c_ltv_model
     click.echo("Running D2C LTV model...")
     run_d2c_ltv_model.main()
     click.echo("D2C LTV model run finished.")
@@ -47,13 +70,34 @@ def run_ltv():
 @isse_cli.command()
 def run_mmm():
     """Runs the D2C Marketing Mix Model (MMM)."""
+    import run_mmm_model as run_d2c_mmm_model
     click.echo("Running D2C Marketing Mix Model...")
     run_d2c_mmm_model.main()
     click.echo("D2C MMM run finished.")
 
+@isse_cli.command()
+@click.option('--spend', type=click.Path(dir_okay=False), required=True,
+              help='Long-format spend: date, <group columns>, channel, spend_inr.')
+@click.option('--target', type=click.Path(dir_okay=False), required=True,
+              help='Long-format target: date, <group columns>, acquisitions.')
+@click.option('--output', type=click.Path(dir_okay=False),
+              default='data/processed/mmm_panel_coefficients.csv', show_default=True)
+@click.option('--group-col', 'group_cols', multiple=True, default=('region', 'category'),
+              show_default=True, help='Column identifying a panel group (repeatable).')
+@click.option('--config', type=click.Path(dir_okay=False),
+              default='configs/mmm_panel.yaml', show_default=True,
+              help='YAML file with per-channel decay_rates and saturation_alphas.')
+def run_mmm_panel(spend, target, output, group_cols, config):
+    """Fits one Marketing Mix Model per region/category group in one batch."""
+    import run_mmm_panel_model
+    click.echo("Running panel D2C Marketing Mix Model...")
+    run_mmm_panel_model.main(spend, target, output, group_cols, config)
+    click.echo("Panel MMM run finished.")
+
 @isse_cli.command()
 def run_b2b_win_prob():
     """Runs the B2B Win Probability model."""
+    import run_b2b_model
     click.echo("Running B2B Win Probability model...")
     run_b2b_model.main()
     click.echo("B2B Win Probability model run finished.")
@@ -61,17 +105,122 @@ def run_b2b_win_prob():
 @isse_cli.command()
 def run_logistics_opt():
     """Runs the logistics route optimization model."""
+    import run_logistics_model
     click.echo("Running logistics route optimization...")
     run_logistics_model.main()
     click.echo("Logistics optimization run finished.")
 
 @isse_cli.command()
-def run_financial_sim():
+@click.option('--d2c-base-from-clv', is_flag=True,
+              help="Use the LTV model's 12-month CLV of existing customers as D2C year-0 revenue.")
+def run_financial_sim(d2c_base_from_clv):
     """Runs the final integrated financial Monte Carlo simulation."""
+    import run_financial_simulation
     click.echo("Running integrated financial simulation...")
-    run_financial_simulation.main()
+    run_financial_simulation.main(d2c_base_from_clv)
     click.echo("Financial simulation finished.")
 
+@isse_cli.command()
+@click.option('--output', type=click.Path(dir_okay=False),
+              default='data/models/financial_emulator.json', show_default=True)
+@click.option('--d2c-base-from-clv', is_flag=True,
+              help="Use the LTV model's 12-month CLV of existing customers as D2C year-0 revenue.")
+def fit_financial_emulator(output, d2c_base_from_clv):
+    """Fits the surrogate emulator for fast financial what-if queries."""
+    import run_financial_emulator
+    click.echo("Fitting financial simulation emulator...")
+    run_financial_emulator.fit(output, d2c_base_from_clv)
+    click.echo("Financial emulator fitting finished.")
+
+@isse_cli.command()
+@click.option('--set', 'overrides', multiple=True, metavar='KEY=VALUE',
+              help='Assumption override (repeatable), e.g. --set gross_margin=0.3 '
+                   '--set d2c_growth.mean=0.18.')
+@click.option('--model', type=click.Path(dir_okay=False),
+              default='data/models/financial_emulator.json', show_default=True)
+def query_financial_emulator(overrides, model):
+    """Answers an NPV what-if query from the fitted emulator."""
+    parsed = {}
+    for override in overrides:
+        key, _, value = override.partition('=')
+        try:
+            parsed[key.strip()] = float(value)
+        except ValueError:
+            raise click.BadParameter(f"expected KEY=VALUE, got '{override}'", param_hint="'--set'")
+    import run_financial_emulator
+    try:
+        run_financial_emulator.query(parsed, model)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--set'")
+
+@isse_cli.command()
+@click.option('--workers', type=int, default=None,
+              help='Maximum number of parallel worker processes.')
+@click.option('--force', is_flag=True,
+              help='Re-run every stage even if its inputs and code are unchanged.')
+def run_all(workers, force):
+    """Runs the full pipeline, executing independent stages in parallel."""
+    from pipeline import PipelineRunner
+    click.echo("Running full ISSE pipeline...")
+    status = PipelineRunner(max_workers=workers, force=force).run()
+    for stage, outcome in status.items():
+        click.echo(f"  {stage}: {outcome}")
+    if any(outcome in ('failed', 'blocked') for outcome in status.values()):
+        raise click.ClickException("One or more pipeline stages failed.")
+    click.echo("Full pipeline finished.")
+
+@isse_cli.command()
+@click.option('--rows', type=int, default=1_000, show_default=True,
+              help='Number of rows to generate per dataset.')
+@click.option('--output-dir', type=click.Path(file_okay=False), default='data/synthetic',
+              show_default=True, help='Directory to write synthetic_<name>.csv files to.')
+@click.option('--seed', type=int, default=42, show_default=True)
+@click.option('--panel-regions', type=click.IntRange(min=0), default=4, show_default=True,
+              help='Regions in the weekly marketing panel for run-mmm-panel (0 to skip).')
+@click.option('--panel-categories', type=click.IntRange(min=1), default=6, show_default=True,
+              help='Product categories per region in the marketing panel.')
+def generate_synthetic_data(rows, output_dir, seed, panel_regions, panel_categories):
+    """Generates seeded, schema-conformant synthetic datasets at any scale."""
+    from isse.io.synthetic import SyntheticDataGenerator
+    generator = SyntheticDataGenerator(seed)
+    click.echo(f"Generating {rows:,} rows per dataset into {output_dir}...")
+    paths = generator.write_all(output_dir, rows)
+    if panel_regions:
+        paths.update(generator.write_marketing_panel(output_dir, panel_regions, panel_categories))
+    for name, path in paths.items():
+        click.echo(f"  {name}: {path}")
+    click.echo("Synthetic data generation finished.")
+
+@isse_cli.command()
+@click.option('--model', 'models', multiple=True,
+              help='Model to benchmark (repeatable), e.g. d2c_ltv. Defaults to all models.')
+@click.option('--size', 'sizes', multiple=True, type=int,
+              help='Input size to benchmark at (repeatable), e.g. --size 1000 --size 100000000.')
+@click.option('--output', type=click.Path(dir_okay=False),
+              default='data/benchmarks/results.json', show_default=True)
+@click.option('--baseline', type=click.Path(dir_okay=False),
+              default='data/benchmarks/baseline.json', show_default=True)
+@click.option('--save-baseline', is_flag=True, help='Store this run as the new baseline.')
+@click.option('--tolerance', type=float, default=0.20, show_default=True,
+              help='Allowed relative slowdown or memory growth before flagging a regression.')
+@click.option('--repeats', type=click.IntRange(min=1), default=3, show_default=True,
+              help='Timed runs per case; the median wall time is reported.')
+def run_benchmark_suite(models, sizes, output, baseline, save_baseline, tolerance, repeats):
+    """Benchmarks every model on synthetic data and checks for regressions."""
+    import run_benchmarks
+    unknown = [m for m in models if m not in run_benchmarks.BENCHMARKS]
+    if unknown:
+        raise click.BadParameter(
+            f"unknown model(s) {unknown}; choose from {list(run_benchmarks.BENCHMARKS)}",
+            param_hint="'--model'",
+        )
+    regressions = run_benchmarks.main(
+        list(models) or None, list(sizes) or None, output, baseline, save_baseline, tolerance,
+        repeats,
+    )
+    if regressions:
+        raise click.ClickException(f"{len(regressions)} performance regression(s) detected.")
+
 
 if __name__ == '__main__':
     isse_cli()
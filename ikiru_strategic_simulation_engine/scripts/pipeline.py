@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+DAG pipeline runner for the ISSE.
+
+Declares the dependencies between the ISSE stages (data processing, the four
+independent models and the final financial simulation), runs independent
+stages concurrently in worker processes and skips any stage whose code,
+inputs and upstream stages are unchanged since the last successful run and
+whose declared outputs still exist unchanged. A stage that finishes without
+(re)writing all of its declared outputs is marked failed.
+
+Every stage imports the shared `isse` package (models, io, instrumentation),
+so the whole package source is part of each stage's fingerprint rather than a
+hand-maintained list of the modules it happens to use. Stages read and write
+paths relative to the project root, so workers always run from there.
+
+When the process-wide profiler is enabled (`isse --profile run-all`), each
+worker profiles its stage and the parent merges the traces.
+"""
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from isse import instrumentation
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SRC_DIR = PROJECT_ROOT / "src"
+DEFAULT_STATE_PATH = PROJECT_ROOT / ".isse_cache" / "pipeline_state.json"
+
+# Source files (glob patterns relative to the project root) hashed into every
+# stage's fingerprint.
+PACKAGE_CODE: Tuple[str, ...] = ("src/isse/**/*.py",)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A single node of the pipeline DAG.
+
+    Attributes:
+        name: Unique stage name.
+        module: Name of the script module whose ``main()`` runs the stage.
+        depends_on: Names of the stages that must finish first.
+        code: Glob patterns (relative to the project root) of the scripts the
+            stage executes, in addition to the shared `PACKAGE_CODE`.
+        inputs: Glob patterns (relative to the project root) of the data
+            files the stage reads.
+        outputs: Glob patterns (relative to the project root) of the files
+            every successful run of the stage writes.
+    """
+    name: str
+    module: str
+    depends_on: Tuple[str, ...] = ()
+    code: Tuple[str, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+STAGES: List[Stage] = [
+    Stage(
+        name="process-data",
+        module="process_data",
+        code=("scripts/process_data.py",),
+        inputs=("data/raw/synthetic_*.csv",),
+        outputs=(
+            "data/processed/processed_orders.csv",
+            "data/processed/processed_marketing_spend.csv",
+            "data/processed/processed_b2b_pipeline.csv",
+        ),
+    ),
+    Stage(
+        name="ltv",
+        module="run_ltv_model",
+        depends_on=("process-data",),
+        code=("scripts/run_ltv_model.py",),
+        inputs=("data/processed/processed_orders.csv",),
+        outputs=("data/processed/customer_ltv_predictions.csv",),
+    ),
+    Stage(
+        name="mmm",
+        module="run_mmm_model",
+        depends_on=("process-data",),
+        code=("scripts/run_mmm_model.py",),
+        inputs=(
+            "data/processed/processed_marketing_spend.csv",
+            "data/processed/processed_orders.csv",
+        ),
+        outputs=("data/processed/mmm_coefficients.csv",),
+    ),
+    Stage(
+        name="b2b",
+        module="run_b2b_model",
+        depends_on=("process-data",),
+        code=("scripts/run_b2b_model.py",),
+        inputs=("data/processed/processed_b2b_pipeline.csv",),
+        outputs=("data/processed/b2b_win_probabilities.csv",),
+    ),
+    Stage(
+        name="logistics",
+        module="run_logistics_model",
+        depends_on=("process-data",),
+        code=("scripts/run_logistics_model.py",),
+        outputs=("data/processed/logistics_routes.json",),
+    ),
+    Stage(
+        name="financial-sim",
+        module="run_financial_simulation",
+        depends_on=("ltv", "mmm", "b2b", "logistics"),
+        code=("scripts/run_financial_simulation.py",),
+        outputs=("data/processed/financial_simulation_results.json",),
+    ),
+]
+
+
+def _init_worker(root: str = str(PROJECT_ROOT)) -> None:
+    """
+    Makes the script modules and the isse package importable in workers and
+    runs them from the project root, where the fingerprinted data lives.
+    """
+    os.chdir(root)
+    for path in (os.path.join(root, "src"), os.path.join(root, "scripts")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _run_stage(
+    name: str, module_name: str, profile: bool = False
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Runs a stage's ``main()`` inside a worker process.
+
+    Returns:
+        Everything the stage printed, so the parent can emit it
+        un-interleaved, and the stage's profiler trace if `profile` is set.
+    """
+    if profile:
+        instrumentation.profiler.enable()
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer), instrumentation.span("pipeline.stage", stage=name):
+            importlib.import_module(module_name).main()
+    finally:
+        if profile:
+            instrumentation.profiler.disable()
+    trace = instrumentation.profiler.to_trace() if profile else None
+    return buffer.getvalue(), trace
+
+
+class PipelineRunner:
+    """
+    Executes the ISSE stages as a dependency graph.
+    """
+    def __init__(
+        self,
+        stages: Optional[List[Stage]] = None,
+        state_path: Path = DEFAULT_STATE_PATH,
+        max_workers: Optional[int] = None,
+        force: bool = False,
+        root: Path = PROJECT_ROOT,
+    ):
+        """
+        Initializes the runner.
+
+        Args:
+            stages: The stages to run. Defaults to the full ISSE pipeline.
+            state_path: JSON file storing the fingerprint of each stage's last
+                successful run.
+            max_workers: Maximum number of worker processes. Defaults to the
+                widest level of the graph.
+            force: If True, every stage is re-run regardless of its fingerprint.
+            root: Directory that stage code, input and output patterns are
+                relative to, and that stages run in.
+        """
+        self.stages = {stage.name: stage for stage in (stages or STAGES)}
+        self.root = Path(root)
+        self.state_path = Path(state_path)
+        self.force = force
+        self._validate_graph()
+        self.max_workers = max_workers or max(
+            1, max(self._level_widths().values(), default=1)
+        )
+
+    def _validate_graph(self) -> None:
+        """Checks that every dependency exists and the graph is acyclic."""
+        for stage in self.stages.values():
+            missing = [dep for dep in stage.depends_on if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+        self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """Returns the stage names in a valid execution order."""
+        order: List[str] = []
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected in pipeline at stage '{name}'.")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _level_widths(self) -> Dict[int, int]:
+        """Returns the number of stages at each depth of the graph."""
+        depth: Dict[str, int] = {}
+        for name in self._topological_order():
+            deps = self.stages[name].depends_on
+            depth[name] = 1 + max((depth[d] for d in deps), default=-1)
+        widths: Dict[int, int] = {}
+        for level in depth.values():
+            widths[level] = widths.get(level, 0) + 1
+        return widths
+
+    def _fingerprint(self, stage: Stage, upstream: Dict[str, str]) -> str:
+        """
+        Hashes a stage's code, its input files and its upstream fingerprints.
+        """
+        digest = hashlib.sha256()
+        digest.update(stage.module.encode())
+        paths = sorted({
+            path for pattern in PACKAGE_CODE + stage.code for path in self.root.glob(pattern)
+        })
+        for pattern in stage.inputs:
+            matches = sorted(self.root.glob(pattern))
+            if not matches:
+                digest.update(f"missing:{pattern}".encode())
+            paths.extend(matches)
+        self._hash_files(digest, paths)
+        for dep in stage.depends_on:
+            digest.update(upstream[dep].encode())
+        return digest.hexdigest()
+
+    def _output_digest(self, stage: Stage) -> Optional[str]:
+        """Hashes a stage's output files; None if any declared output is missing."""
+        digest = hashlib.sha256()
+        for pattern in stage.outputs:
+            matches = sorted(self.root.glob(pattern))
+            if not matches:
+                return None
+            self._hash_files(digest, matches)
+        return digest.hexdigest()
+
+    def _stale_outputs(self, stage: Stage, since: float) -> List[str]:
+        """Returns the output patterns with no file written at or after `since`."""
+        return [
+            pattern for pattern in stage.outputs
+            if not any(path.stat().st_mtime >= since for path in self.root.glob(pattern))
+        ]
+
+    def _hash_files(self, digest, paths: List[Path]) -> None:
+        for path in paths:
+            digest.update(str(path.relative_to(self.root)).encode())
+            if not path.exists():
+                digest.update(b"missing")
+                continue
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        if self.force or not self.state_path.exists():
+            return {}
+        try:
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: Dict[str, Dict[str, str]]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+
+    def run(self) -> Dict[str, str]:
+        """
+        Runs the pipeline.
+
+        Returns:
+            A dictionary mapping each stage name to its outcome: 'ran',
+            'skipped' (unchanged since the last run), 'failed' (raised, or
+            did not write its outputs) or 'blocked' (an upstream stage failed).
+        """
+        profile = instrumentation.profiler.enabled
+        previous = self._load_state()
+        state = dict(previous)
+        fingerprints: Dict[str, str] = {}
+        status: Dict[str, str] = {}
+        running: Dict[Future, Tuple[str, str]] = {}
+        started: Dict[str, float] = {}
+
+        def ready() -> List[str]:
+            return [
+                name for name, stage in self.stages.items()
+                if name not in status
+                and name not in (n for n, _ in running.values())
+                and all(status.get(dep) in ("ran", "skipped") for dep in stage.depends_on)
+            ]
+
+        def block_downstream() -> None:
+            changed = True
+            while changed:
+                changed = False
+                for name, stage in self.stages.items():
+                    if name not in status and any(
+                        status.get(dep) in ("failed", "blocked") for dep in stage.depends_on
+                    ):
+                        status[name] = "blocked"
+                        print(f"[{name}] blocked by failed upstream stage.")
+                        changed = True
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(str(self.root),)
+        ) as pool:
+            while len(status) < len(self.stages):
+                for name in ready():
+                    stage = self.stages[name]
+                    fingerprint = self._fingerprint(stage, fingerprints)
+                    fingerprints[name] = fingerprint
+                    last_run = previous.get(name)
+                    if (
+                        isinstance(last_run, dict)
+                        and last_run.get("fingerprint") == fingerprint
+                        and last_run.get("outputs") == self._output_digest(stage)
+                    ):
+                        status[name] = "skipped"
+                        print(f"[{name}] unchanged since last run, skipping.")
+                        continue
+                    print(f"[{name}] started.")
+                    # Coarse filesystem timestamps may round an output's mtime down.
+                    started[name] = time.time() - 1.0
+                    running[pool.submit(_run_stage, name, stage.module, profile)] = (name, fingerprint)
+
+                if not running:
+                    block_downstream()
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name, fingerprint = running.pop(future)
+                    try:
+                        output, trace = future.result()
+                    except Exception as e:
+                        status[name] = "failed"
+                        state.pop(name, None)
+                        print(f"[{name}] failed: {e}")
+                        continue
+                    if trace is not None:
+                        instrumentation.profiler.merge(trace, stage=name)
+                    for line in output.splitlines():
+                        print(f"[{name}] {line}")
+                    stale = self._stale_outputs(self.stages[name], started[name])
+                    if stale:
+                        status[name] = "failed"
+                        state.pop(name, None)
+                        print(f"[{name}] failed: did not write {', '.join(stale)}")
+                        continue
+                    status[name] = "ran"
+                    state[name] = {
+                        "fingerprint": fingerprint,
+                        "outputs": self._output_digest(self.stages[name]),
+                    }
+                    print(f"[{name}] finished.")
+                block_downstream()
+
+        self._save_state(state)
+        return status
@@ -32,6 +32,13 @@ def main():
     for i, prob in enumerate(win_probabilities):
         print(f"  Lead {sample_leads.iloc[i]['lead_id']}: {prob:.2%}")
 
+    output_path = Path("data/processed/b2b_win_probabilities.csv")
+    pd.DataFrame({
+        'lead_id': pipeline_df['lead_id'],
+        'win_probability': fitted_model.predict_proba(pipeline_df),
+    }).to_csv(output_path, index=False)
+    print(f"\nSaved win probabilities for all leads to {output_path}")
+
 
 if __name__ == "__main__":
     main()
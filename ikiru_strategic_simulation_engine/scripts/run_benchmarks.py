@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the ISSE models at production scale.
+
+Generates seeded synthetic data with `SyntheticDataGenerator`, then records
+wall time, throughput and peak memory for each model at each requested size.
+Every case runs in a fresh worker process and its model call is repeated;
+the median wall time is reported. Memory is reported as the peak RSS increase
+over a sample taken right before the model call, so imports and data setup
+are not attributed to the model. A case that raises is recorded with its
+error and the suite moves on. Results are stored as JSON and compared
+against a saved baseline. Under `isse --profile`, each worker profiles its
+model calls and the traces are merged into the parent's profile.
+"""
+import importlib
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from isse import instrumentation
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_RESULTS_PATH = Path("data/benchmarks/results.json")
+DEFAULT_BASELINE_PATH = Path("data/benchmarks/baseline.json")
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_REPEATS = 3
+MMM_PANEL_CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "mmm_panel.yaml"
+
+# A change must exceed both the relative tolerance and these absolute floors
+# to count as a regression, so noise on sub-second cases is not flagged.
+# Solution quality metrics (lower is better) are checked the same way.
+REGRESSION_FLOORS = {'wall_time_s': 0.25, 'peak_rss_increase_mb': 16.0, 'total_distance': 0.0}
+
+# The VRP search runs until no local improvement is left, which takes minutes
+# at 1,000 locations, so it is bounded by this solver limit. Wall time then
+# mostly measures the limit; the route distance found within it is what the
+# logistics case checks for regressions.
+LOGISTICS_TIME_LIMIT_S = 10
+
+
+# --- Benchmark cases ------------------------------------------------------
+# Each case has a setup step (data generation, excluded from timing) and a
+# run step (the timed model call). `size` is the number of input rows, or the
+# number of locations / simulations where that is the natural unit. A run step
+# may return a dict of solution quality metrics to record with the timings.
+
+def _setup_ltv(size: int, seed: int) -> Any:
+    from isse.io.synthetic import SyntheticDataGenerator
+    return SyntheticDataGenerator(seed).generate('orders', size)
+
+
+def _run_ltv(orders_df) -> None:
+    from isse.models.d2c_ltv import D2CLTVModel
+    D2CLTVModel().fit(orders_df).predict_future_purchases()
+
+
+def _setup_clv(size: int, seed: int) -> Any:
+    import numpy as np
+    from lifetimes.datasets import load_cdnow_summary_data_with_monetary_value
+    from isse.models.d2c_ltv import D2CLTVModel
+    # The models are fitted once on the full CDNOW sample, which identifies
+    # them well; the timed CLV evaluation then runs over that sample tiled (or
+    # cut) to `size` customers.
+    cdnow = load_cdnow_summary_data_with_monetary_value()
+    model = D2CLTVModel()
+    model.summary_data = cdnow
+    model.fit_clv()
+    model.summary_data = cdnow.iloc[np.arange(size) % len(cdnow)].reset_index(drop=True)
+    return model
+
+
+def _run_clv(ltv_model) -> None:
+    import numpy as np
+    ltv_model.customer_lifetime_value(dtype=np.float32)
+
+
+def _setup_mmm(size: int, seed: int) -> Any:
+    import numpy as np
+    import pandas as pd
+    from isse.io.synthetic import MAX_SPEND_WEEKS, SyntheticDataGenerator
+    # Weekly spend runs out of dates after MAX_SPEND_WEEKS rows, so larger cases
+    # repeat it; the model only needs the periods in order, not their dates.
+    weeks = SyntheticDataGenerator(seed).generate('marketing_spend', min(size, MAX_SPEND_WEEKS))
+    spend_df = pd.concat(
+        [weeks.drop(columns='date')] * -(-size // len(weeks)), ignore_index=True
+    ).iloc[:size].rename_axis('period')
+    rng = np.random.default_rng(seed)
+    target = (
+        1e-4 * spend_df['social_media'] + 5e-5 * spend_df['search']
+        + 1e-4 * spend_df['influencer'] + rng.normal(0, 1, size)
+    ).rename('acquisitions')
+    return spend_df, target
+
+
+def _run_mmm(payload) -> None:
+    from isse.models.d2c_mmm import MarketingMixModel
+    spend_df, target = payload
+    MarketingMixModel(spend_df, target).fit(
+        {'social_media': 0.5, 'search': 0.2, 'influencer': 0.6},
+        {'social_media': 0.01, 'search': 0.005, 'influencer': 0.015},
+    ).get_coefficients()
+
+
+def _setup_mmm_panel(size: int, seed: int) -> Any:
+    import yaml
+    from isse.io.synthetic import PANEL_CHANNELS, SyntheticDataGenerator
+    # `size` long-format spend rows: 156 weekly dates x 3 channels per region.
+    n_regions = max(1, size // (156 * len(PANEL_CHANNELS)))
+    spend_long, target_long = SyntheticDataGenerator(seed).marketing_panel(n_regions, n_categories=1)
+    config = yaml.safe_load(MMM_PANEL_CONFIG_PATH.read_text())
+    return spend_long, target_long, config['decay_rates'], config['saturation_alphas']
+
+
+def _run_mmm_panel(payload) -> None:
+    from isse.models.d2c_mmm import PanelMarketingMixModel
+    spend_long, target_long, decay_rates, saturation_alphas = payload
+    PanelMarketingMixModel(spend_long, target_long).fit(
+        {c: decay_rates[c] for c in spend_long['channel'].unique()},
+        {c: saturation_alphas[c] for c in spend_long['channel'].unique()},
+    ).get_coefficients()
+
+
+def _setup_b2b(size: int, seed: int) -> Any:
+    from isse.io.synthetic import SyntheticDataGenerator
+    return SyntheticDataGenerator(seed).generate('b2b_pipeline', size)
+
+
+def _run_b2b(pipeline_df) -> None:
+    from isse.models.b2b_win_probability import B2BWinProbabilityModel
+    _, fitted = B2BWinProbabilityModel(pipeline_df).train_and_evaluate()
+    fitted.predict_proba(pipeline_df)
+
+
+def _setup_logistics(size: int, seed: int) -> Any:
+    import numpy as np
+    from isse.io.synthetic import SyntheticDataGenerator
+    locations = SyntheticDataGenerator(seed).generate('customer_locations', size)
+    lat = np.radians(locations['latitude'].to_numpy())
+    lon = np.radians(locations['longitude'].to_numpy())
+    # Haversine distance in metres; location 0 acts as the depot.
+    a = (
+        np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+        + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2
+    )
+    distances = 2 * 6_371_000 * np.arcsin(np.sqrt(a))
+    return distances.astype(int).tolist()
+
+
+def _run_logistics(distance_matrix) -> Dict[str, float]:
+    from isse.models.logistics_optimization import LogisticsOptimizer
+    solution = LogisticsOptimizer(
+        distance_matrix, num_vehicles=max(1, len(distance_matrix) // 100)
+    ).solve(time_limit_s=LOGISTICS_TIME_LIMIT_S)
+    if 'error' in solution:
+        raise RuntimeError(solution['error'])
+    return {'total_distance': solution['total_distance']}
+
+
+def _setup_financial(size: int, seed: int) -> Any:
+    assumptions = {
+        'd2c_rev_y0': 52_600_000,
+        'b2b_rev_y0': 35_600_000,
+        'd2c_growth': {'mean': 0.15, 'std': 0.05},
+        'b2b_growth': {'mean': 0.20, 'std': 0.08},
+        'gross_margin': 0.28,
+        'op_ex_percent': 0.25,
+        'discount_rate': 0.12,
+    }
+    return assumptions, size
+
+
+def _run_financial(payload) -> None:
+    from isse.models.financial_simulation import FinancialSimulator
+    assumptions, n_simulations = payload
+    FinancialSimulator(assumptions, n_simulations=n_simulations).run_simulation()
+
+
+# name -> (model module, setup, run, max_size). The model module is imported
+# before timing starts so one-off import cost does not skew small sizes. Cases
+# above max_size are reported as skipped: the VRP distance matrix grows
+# quadratically with the number of locations.
+BENCHMARKS: Dict[str, Tuple[str, Callable, Callable, Optional[int]]] = {
+    'd2c_ltv': ('isse.models.d2c_ltv', _setup_ltv, _run_ltv, None),
+    'd2c_clv': ('isse.models.d2c_ltv', _setup_clv, _run_clv, None),
+    'd2c_mmm': ('isse.models.d2c_mmm', _setup_mmm, _run_mmm, None),
+    'd2c_mmm_panel': ('isse.models.d2c_mmm', _setup_mmm_panel, _run_mmm_panel, None),
+    'b2b_win_probability': ('isse.models.b2b_win_probability', _setup_b2b, _run_b2b, None),
+    'logistics_optimization': (
+        'isse.models.logistics_optimization', _setup_logistics, _run_logistics, 1_000
+    ),
+    'financial_simulation': (
+        'isse.models.financial_simulation', _setup_financial, _run_financial, None
+    ),
+}
+
+
+def _run_case(
+    name: str, size: int, seed: int, repeats: int, profile: bool = False
+) -> Dict[str, Any]:
+    """
+    Runs one benchmark case; executed inside a fresh worker process.
+
+    If `profile` is set, the timed model calls are profiled and the trace is
+    returned under 'trace'.
+    """
+    module, setup, run, _ = BENCHMARKS[name]
+    importlib.import_module(module)
+    payload = setup(size, seed)
+    if profile:
+        instrumentation.profiler.enable()
+    wall_times, rss_increases = [], []
+    for _ in range(repeats):
+        instrumentation.reset_peak_rss()
+        rss_before = instrumentation.current_rss_bytes() / 2 ** 20
+        start = time.perf_counter()
+        quality = run(payload)
+        wall_times.append(time.perf_counter() - start)
+        rss_increases.append(instrumentation.peak_rss_bytes() / 2 ** 20 - rss_before)
+    wall_time = statistics.median(wall_times)
+    result = {
+        'model': name,
+        'size': size,
+        'repeats': repeats,
+        'wall_time_s': wall_time,
+        'wall_time_min_s': min(wall_times),
+        'throughput_rows_per_s': size / wall_time if wall_time > 0 else None,
+        'peak_rss_increase_mb': max(rss_increases),
+        'rss_before_run_mb': rss_before,
+        **(quality or {}),
+    }
+    if profile:
+        instrumentation.profiler.disable()
+        result['trace'] = instrumentation.profiler.to_trace()
+    return result
+
+
+def run_benchmarks(
+    models: Optional[List[str]] = None,
+    sizes: Optional[List[int]] = None,
+    seed: int = 42,
+    repeats: int = DEFAULT_REPEATS,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite.
+
+    Args:
+        models: Benchmark names to run. Defaults to all of `BENCHMARKS`.
+        sizes: Input sizes to run each model at. Defaults to `DEFAULT_SIZES`.
+        seed: Seed for the synthetic data generator.
+        repeats: Number of timed model calls per case; the median is reported.
+
+    Returns:
+        A JSON-serializable dictionary with run metadata and one result per
+        case. A case that raised is recorded as {'model', 'size', 'error'}.
+    """
+    models = models or list(BENCHMARKS)
+    sizes = sizes or DEFAULT_SIZES
+    unknown = [m for m in models if m not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown}. Choose from {list(BENCHMARKS)}.")
+
+    results = []
+    profile = instrumentation.profiler.enabled
+    ctx = multiprocessing.get_context('spawn')
+    for name in models:
+        max_size = BENCHMARKS[name][3]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                print(f"  {name} @ {size:,}: skipped (max size {max_size:,})")
+                results.append({'model': name, 'size': size, 'skipped': True})
+                continue
+            try:
+                with ctx.Pool(processes=1) as pool:
+                    result = pool.apply(_run_case, (name, size, seed, repeats, profile))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"  {name} @ {size:,}: failed ({error})")
+                results.append({'model': name, 'size': size, 'error': error})
+                continue
+            if profile:
+                instrumentation.profiler.merge(result.pop('trace'), model=name, size=size)
+            print(
+                f"  {name} @ {size:,}: {result['wall_time_s']:.3f}s median of {repeats}, "
+                f"+{result['peak_rss_increase_mb']:.0f} MiB peak RSS"
+            )
+            results.append(result)
+
+    return {
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeats': repeats,
+        },
+        'results': results,
+    }
+
+
+def find_regressions(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    Compares a benchmark run against a baseline.
+
+    Args:
+        current: Output of `run_benchmarks`.
+        baseline: A previously saved output of `run_benchmarks`.
+        tolerance: Allowed relative increase in wall time, peak RSS increase
+            or solution quality metric. Changes within `REGRESSION_FLOORS`
+            are never flagged. A case that fails but passed in the baseline
+            is always flagged.
+
+    Returns:
+        A human-readable description of each regression found.
+    """
+    reference = {
+        (r['model'], r['size']): r for r in baseline.get('results', [])
+        if not r.get('skipped') and 'error' not in r
+    }
+    regressions = []
+    for result in current['results']:
+        base = reference.get((result['model'], result['size']))
+        if result.get('skipped') or base is None:
+            continue
+        if 'error' in result:
+            regressions.append(f"{result['model']} @ {result['size']:,}: failed ({result['error']})")
+            continue
+        for metric, floor in REGRESSION_FLOORS.items():
+            if metric not in base or metric not in result:
+                continue
+            if (
+                result[metric] > base[metric] * (1 + tolerance)
+                and result[metric] - base[metric] > floor
+            ):
+                regressions.append(
+                    f"{result['model']} @ {result['size']:,}: {metric} "
+                    f"{base[metric]:.3f} -> {result[metric]:.3f} "
+                    f"(+{result[metric] - base[metric]:.3f})"
+                )
+    return regressions
+
+
+def main(
+    models: Optional[List[str]] = None,
+    sizes: Optional[List[int]] = None,
+    output_path: Path = DEFAULT_RESULTS_PATH,
+    baseline_path: Path = DEFAULT_BASELINE_PATH,
+    save_baseline: bool = False,
+    tolerance: float = DEFAULT_TOLERANCE,
+    repeats: int = DEFAULT_REPEATS,
+) -> List[str]:
+    """
+    Main function to run the benchmark suite and check for regressions.
+
+    Returns:
+        The list of regressions against the baseline (empty if none).
+    """
+    print("Running ISSE benchmark suite...")
+    current = run_benchmarks(models, sizes, repeats=repeats)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(current, indent=2))
+    print(f"Saved benchmark results to {output_path}")
+    failed = [r for r in current['results'] if 'error' in r]
+    if failed:
+        print(f"{len(failed)} benchmark case(s) failed; see 'error' in {output_path}.")
+
+    baseline_path = Path(baseline_path)
+    if save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(current, indent=2))
+        print(f"Saved results as the new baseline at {baseline_path}")
+        return []
+
+    if not baseline_path.exists():
+        print(f"No baseline found at {baseline_path}; skipping regression check.")
+        return []
+
+    regressions = find_regressions(current, json.loads(baseline_path.read_text()), tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {baseline_path}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    else:
+        print("No regressions against the baseline.")
+    return regressions
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Script to fit and query the FinancialSimulator surrogate emulator.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from isse.models.financial_emulator import FinancialEmulator
+from run_financial_simulation import load_assumptions
+
+DEFAULT_EMULATOR_PATH = Path("data/models/financial_emulator.json")
+
+
+def fit(
+    output_path: Path = DEFAULT_EMULATOR_PATH,
+    d2c_base_from_clv: bool = False,
+) -> Optional[FinancialEmulator]:
+    """
+    Runs the offline design simulations, fits the emulator and saves it.
+
+    Args:
+        output_path: Where to save the fitted emulator.
+        d2c_base_from_clv: Take the D2C year-0 revenue from the LTV model's
+            CLV summary, as `run-financial-sim --d2c-base-from-clv` does.
+    """
+    try:
+        assumptions = load_assumptions(d2c_base_from_clv)
+    except FileNotFoundError as e:
+        print(e)
+        return None
+    emulator = FinancialEmulator(assumptions)
+    print(
+        f"Running {emulator.n_design_points} design simulations over "
+        f"{', '.join(emulator.inputs)}..."
+    )
+    emulator.fit()
+    emulator.save(output_path)
+    print(f"Emulator saved to {output_path}")
+
+    print("\nLeave-one-out error bounds (max absolute error):")
+    for output, bound in emulator.error_bounds.items():
+        print(f"  {output}: ₹{bound:,.0f} (RMSE ₹{emulator.rmse[output]:,.0f})")
+    return emulator
+
+
+def query(
+    overrides: Optional[Dict[str, float]] = None,
+    model_path: Path = DEFAULT_EMULATOR_PATH,
+) -> Optional[Dict]:
+    """
+    Answers a what-if query from a saved emulator.
+
+    Args:
+        overrides: Dotted-key assumption values, e.g. {'gross_margin': 0.3}.
+        model_path: Path of an emulator saved by `fit`.
+    """
+    model_path = Path(model_path)
+    if not model_path.exists():
+        print(f"No fitted emulator found at {model_path}. Please fit the emulator first.")
+        return None
+
+    emulator = FinancialEmulator.load(model_path)
+    start = time.perf_counter()
+    results = emulator.query(overrides)
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+
+    bounds = results['error_bounds'] or {}
+
+    def fmt(value: float, output: str) -> str:
+        bound = bounds.get(output)
+        return f"₹{value:,.0f}" + (f" ± ₹{bound:,.0f}" if bound is not None else "")
+
+    print(f"\n--- What-if NPV ({results['source']}, {elapsed_ms:.3f} ms) ---")
+    print(f"Mean 5-Year NPV: {fmt(results['npv_mean'], 'npv_mean')}")
+    print(f"Std Dev of NPV:  {fmt(results['npv_std'], 'npv_std')}")
+    print("\nNPV Distribution Percentiles:")
+    print(f"  5th Percentile:  {fmt(results['npv_percentiles']['p5'], 'p5')}")
+    print(f"  50th Percentile: {fmt(results['npv_percentiles']['p50'], 'p50')} (Median)")
+    print(f"  95th Percentile: {fmt(results['npv_percentiles']['p95'], 'p95')}")
+    print("---------------------------------")
+    return results
+
+
+if __name__ == "__main__":
+    fit()
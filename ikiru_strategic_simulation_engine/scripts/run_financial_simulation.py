@@ -2,24 +2,76 @@
 """
 Script to run the integrated financial Monte Carlo simulation.
 """
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict
+
 from isse.models.financial_simulation import FinancialSimulator
 
-def main():
+# Written by the LTV stage. Only used when explicitly requested: the discounted
+# 12-month CLV of existing customers is a proxy for, not a measurement of, the
+# D2C year-0 revenue (it excludes new customers and is discounted).
+CLV_SUMMARY_PATH = Path("data/processed/d2c_clv_summary.json")
+RESULTS_PATH = Path("data/processed/financial_simulation_results.json")
+
+# These assumptions would be loaded from a config file or derived from
+# the outputs of other models in a full pipeline.
+ASSUMPTIONS = {
+    'd2c_rev_y0': 52_600_000,
+    'b2b_rev_y0': 35_600_000,
+    'd2c_growth': {'mean': 0.15, 'std': 0.05},
+    'b2b_growth': {'mean': 0.20, 'std': 0.08},
+    'gross_margin': 0.28,
+    'op_ex_percent': 0.25,
+    'discount_rate': 0.12,
+}
+
+def load_assumptions(
+    d2c_base_from_clv: bool = False,
+    clv_summary_path: Path = CLV_SUMMARY_PATH,
+) -> Dict[str, Any]:
     """
-    Main function to execute the financial simulation.
+    Returns the simulation assumptions.
+
+    Args:
+        d2c_base_from_clv: If True, replace the static D2C year-0 revenue with
+            the total CLV from the LTV model's summary.
+        clv_summary_path: Summary written by `run_ltv_model`.
+
+    Raises:
+        FileNotFoundError: If `d2c_base_from_clv` is set but no summary exists.
     """
-    # These assumptions would be loaded from a config file or derived from
-    # the outputs of other models in a full pipeline.
-    assumptions = {
-        'd2c_rev_y0': 52_600_000,
-        'b2b_rev_y0': 35_600_000,
-        'd2c_growth': {'mean': 0.15, 'std': 0.05},
-        'b2b_growth': {'mean': 0.20, 'std': 0.08},
-        'gross_margin': 0.28,
-        'op_ex_percent': 0.25,
-        'discount_rate': 0.12,
-    }
+    assumptions = copy.deepcopy(ASSUMPTIONS)
+    if not d2c_base_from_clv:
+        return assumptions
 
+    clv_summary_path = Path(clv_summary_path)
+    if not clv_summary_path.exists():
+        raise FileNotFoundError(
+            f"CLV summary not found at {clv_summary_path}. Please run the LTV model first."
+        )
+    summary = json.loads(clv_summary_path.read_text())
+    assumptions['d2c_rev_y0'] = summary['total_clv_inr']
+    print(
+        f"Using the {summary['horizon_months']}-month CLV of {summary['n_customers']:,} "
+        f"existing customers (₹{summary['total_clv_inr']:,.0f}) as D2C year-0 revenue."
+    )
+    return assumptions
+
+def main(d2c_base_from_clv: bool = False):
+    """
+    Main function to execute the financial simulation.
+
+    Args:
+        d2c_base_from_clv: Take the D2C year-0 revenue from the LTV model's
+            CLV summary instead of the static assumption.
+    """
+    try:
+        assumptions = load_assumptions(d2c_base_from_clv)
+    except FileNotFoundError as e:
+        print(e)
+        return
     simulator = FinancialSimulator(assumptions, n_simulations=10000)
 
     print("Running Monte Carlo financial simulation...")
@@ -35,6 +87,16 @@ def main():
     print(f"  95th Percentile: ₹{results['npv_percentiles']['p95']:,.0f}")
     print("---------------------------------")
 
+    summary = {
+        'assumptions': assumptions,
+        'npv_mean': float(results['npv_mean']),
+        'npv_std': float(results['npv_std']),
+        'npv_percentiles': {k: float(v) for k, v in results['npv_percentiles'].items()},
+    }
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(summary, indent=2))
+    print(f"Saved simulation summary to {RESULTS_PATH}")
+
 
 if __name__ == "__main__":
     main()
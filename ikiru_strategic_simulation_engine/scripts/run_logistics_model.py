@@ -2,7 +2,9 @@
 """
 Script to run the logistics route optimization model.
 """
+import json
 import numpy as np
+from pathlib import Path
 from isse.models.logistics_optimization import LogisticsOptimizer
 
 def main():
@@ -37,6 +39,11 @@ def main():
             print(f"  Route for {vehicle}: {' -> '.join(map(str, route))}")
         print("--------------------------")
 
+        output_path = Path("data/processed/logistics_routes.json")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(solution, indent=2))
+        print(f"Saved route plan to {output_path}")
+
 
 if __name__ == "__main__":
     main()
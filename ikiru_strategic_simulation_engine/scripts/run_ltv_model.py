@@ -1,49 +1,76 @@
 # -*- coding: utf-8 -*-
 """
-Script to run the D2C Marketing Mix Model (MMM).
+Script to run the D2C Customer Lifetime Value (LTV) model.
 """
+import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from isse.models.d2c_mmm import MarketingMixModel
+from isse.models.d2c_ltv import D2CLTVModel
+
+PREDICTIONS_PATH = Path("data/processed/customer_ltv_predictions.csv")
+CLV_SUMMARY_PATH = Path("data/processed/d2c_clv_summary.json")
+
+CLV_HORIZON_MONTHS = 12
+CLV_MONTHLY_DISCOUNT_RATE = 0.01
 
 def main():
     """
-    Main function to execute the D2C MMM pipeline.
+    Main function to execute the D2C LTV pipeline.
     """
-    # For MMM, we need both spend and a target variable (e.g., acquisitions)
-    spend_path = Path("data/processed/processed_marketing_spend.csv")
     orders_path = Path("data/processed/processed_orders.csv")
 
-    if not spend_path.exists() or not orders_path.exists():
-        print("Processed marketing spend or orders data not found. Please run the data processing pipeline first.")
+    if not orders_path.exists():
+        print("Processed orders data not found. Please run the data processing pipeline first.")
         return
 
-    spend_df = pd.read_csv(spend_path, parse_dates=['date'], index_col='date')
     orders_df = pd.read_csv(orders_path, parse_dates=['order_date'])
-    
-    # Aggregate orders to weekly acquisitions to match spend data
-    acquisitions = orders_df.set_index('order_date').resample('W-MON').size().rename('acquisitions')
-    
-    # Align data
-    aligned_df = spend_df.join(acquisitions, how='inner')
-    
-    spend_cols = ['social_media', 'search', 'influencer']
-    target_col = 'acquisitions'
-
-    mmm = MarketingMixModel(aligned_df[spend_cols], aligned_df[target_col])
-
-    # These hyperparameters would typically be found through optimization/calibration
-    decay_rates = {'social_media': 0.5, 'search': 0.2, 'influencer': 0.6}
-    saturation_alphas = {'social_media': 0.01, 'search': 0.005, 'influencer': 0.015}
-
-    print("Fitting Marketing Mix Model...")
-    mmm.fit(decay_rates, saturation_alphas)
+
+    ltv_model = D2CLTVModel()
+
+    print("Fitting Pareto/NBD purchase model...")
+    ltv_model.fit(orders_df)
+    predictions = ltv_model.predict_future_purchases()
+
+    print("Fitting BG/NBD and Gamma-Gamma CLV models...")
+    try:
+        ltv_model.fit_clv()
+        # float32 output keeps the per-customer result compact for large bases.
+        clv = ltv_model.customer_lifetime_value(
+            time_months=CLV_HORIZON_MONTHS,
+            discount_rate=CLV_MONTHLY_DISCOUNT_RATE,
+            dtype=np.float32,
+        )
+    except RuntimeError as e:
+        clv = None
+        print(f"Skipping monetary CLV: {e}")
     print("Model fitting complete.")
-    
-    coefficients = mmm.get_coefficients()
-    print("\nFitted Channel Coefficients (Contribution):")
-    for channel, coef in coefficients.items():
-        print(f"  {channel}: {coef:.2f}")
+
+    if clv is not None:
+        predictions = predictions.join(clv)
+    PREDICTIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    predictions.to_csv(PREDICTIONS_PATH)
+    print(f"Saved customer predictions to {PREDICTIONS_PATH}")
+
+    if clv is None:
+        # Never leave a summary from an earlier run behind for the simulation.
+        CLV_SUMMARY_PATH.unlink(missing_ok=True)
+        return
+
+    # Summed in float64 so the total does not lose precision over many customers.
+    total_clv = float(clv.to_numpy(dtype=np.float64).sum())
+    summary = {
+        'total_clv_inr': total_clv,
+        'n_customers': int(len(clv)),
+        'horizon_months': CLV_HORIZON_MONTHS,
+        'monthly_discount_rate': CLV_MONTHLY_DISCOUNT_RATE,
+    }
+    CLV_SUMMARY_PATH.write_text(json.dumps(summary, indent=2))
+    print(f"Saved CLV summary to {CLV_SUMMARY_PATH}")
+
+    print(f"\n{CLV_HORIZON_MONTHS}-Month CLV of the Customer Base: ₹{total_clv:,.0f}")
+    print(f"  Customers: {len(clv):,}")
+    print(f"  Mean CLV:  ₹{total_clv / len(clv):,.0f}")
 
 
 if __name__ == "__main__":
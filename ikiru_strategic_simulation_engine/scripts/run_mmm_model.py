@@ -45,6 +45,10 @@ def main():
     for channel, coef in coefficients.items():
         print(f"  {channel}: {coef:.2f}")
 
+    output_path = Path("data/processed/mmm_coefficients.csv")
+    pd.Series(coefficients, name='coefficient').rename_axis('channel').to_csv(output_path)
+    print(f"\nSaved channel coefficients to {output_path}")
+
 
 if __name__ == "__main__":
     main()
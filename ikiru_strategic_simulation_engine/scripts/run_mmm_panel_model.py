@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Script to run the panel D2C Marketing Mix Model (one MMM per region/category).
+
+Spend and target panels are long-format CSVs, e.g. as written by
+`main.py generate-synthetic-data`. Per-channel adstock decay rates and
+saturation alphas are read from `configs/mmm_panel.yaml`.
+"""
+import sys
+import pandas as pd
+import yaml
+from pathlib import Path
+from isse.models.d2c_mmm import PanelMarketingMixModel
+
+DEFAULT_CONFIG_PATH = Path("configs/mmm_panel.yaml")
+DEFAULT_OUTPUT_PATH = Path("data/processed/mmm_panel_coefficients.csv")
+
+def main(
+    spend_path: Path,
+    target_path: Path,
+    output_path: Path = DEFAULT_OUTPUT_PATH,
+    group_cols=('region', 'category'),
+    config_path: Path = DEFAULT_CONFIG_PATH,
+):
+    """
+    Main function to execute the panel MMM pipeline.
+    """
+    spend_path, target_path = Path(spend_path), Path(target_path)
+    if not spend_path.exists() or not target_path.exists():
+        print("Panel marketing spend or target data not found. "
+              f"Expected {spend_path} and {target_path}.")
+        return
+
+    config_path = Path(config_path)
+    if not config_path.exists():
+        print(f"Panel MMM config not found at {config_path}.")
+        return
+    config = yaml.safe_load(config_path.read_text())
+    decay_rates, saturation_alphas = config['decay_rates'], config['saturation_alphas']
+
+    # Long format: date, <group_cols>, channel, spend_inr / date, <group_cols>, acquisitions
+    spend_long = pd.read_csv(spend_path, parse_dates=['date'])
+    target_long = pd.read_csv(target_path, parse_dates=['date'])
+
+    channels = sorted(spend_long['channel'].unique())
+    missing = [c for c in channels if c not in decay_rates or c not in saturation_alphas]
+    if missing:
+        print(f"No hyperparameters for channel(s) {', '.join(missing)} in {config_path}.")
+        return
+
+    panel = PanelMarketingMixModel(spend_long, target_long, group_cols=group_cols)
+
+    print(f"Fitting panel Marketing Mix Model over {', '.join(group_cols)}...")
+    coefficients = panel.fit(
+        {c: decay_rates[c] for c in channels},
+        {c: saturation_alphas[c] for c in channels},
+    ).get_coefficients()
+    print(f"Fitted {len(coefficients):,} group models.")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    coefficients.to_csv(output_path)
+    print(f"Saved panel coefficient table to {output_path}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Usage: run_mmm_panel_model.py SPEND_CSV TARGET_CSV")
+    main(sys.argv[1], sys.argv[2])
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Lightweight profiling and metrics instrumentation for the ISSE.
+
+Hot paths across the engine (loading, validation, RFM building, adstock,
+model fitting, routing, Monte Carlo) are wrapped in named spans and counters.
+Instrumentation is disabled by default: `span()` then returns a shared no-op
+context manager and `increment()` returns immediately, so the overhead is a
+single attribute check. When enabled (e.g. via the CLI `--profile` flag), each
+span records its wall time and the peak RSS observed while it was open, and
+the collected data can be exported as a JSON trace or in the Prometheus text
+exposition format. Work done in worker processes is collected by enabling the
+profiler in the worker and merging its trace into the parent with `merge()`.
+The RSS readings behind the memory samples are also available directly via
+`current_rss_bytes()`, `peak_rss_bytes()` and `reset_peak_rss()`.
+"""
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _rusage_peak_bytes() -> int:
+    """Lifetime peak RSS from getrusage, or 0 where that is unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows: neither /proc nor getrusage.
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def current_rss_bytes() -> int:
+    """Current resident set size, falling back to the process peak if unknown."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return _rusage_peak_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """
+    Peak resident set size of this process. On Linux this is the peak since
+    the last `reset_peak_rss()`; elsewhere it is the lifetime peak.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return _rusage_peak_bytes()
+
+
+def reset_peak_rss() -> None:
+    """Resets the kernel's peak RSS mark to the current RSS (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+@dataclass
+class SpanRecord:
+    """A completed (or in-flight) instrumented span."""
+    name: str
+    start_s: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_s: float = 0.0
+    start_rss_bytes: int = 0
+    peak_rss_bytes: int = 0
+    depth: int = 0
+
+
+class Profiler:
+    """
+    Collects span timings, counters and peak-memory samples.
+    """
+    def __init__(self, sample_interval_s: float = 0.01):
+        """
+        Initializes a disabled profiler.
+
+        Args:
+            sample_interval_s: How often the background thread samples RSS
+                while the profiler is enabled.
+        """
+        self.enabled = False
+        self.sample_interval_s = sample_interval_s
+        self.spans: List[SpanRecord] = []
+        self.counters: Dict[str, float] = {}
+        self._open: List[SpanRecord] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._origin_unix_s = time.time()
+        self._stop_sampler = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def enable(self) -> None:
+        """Starts collecting data and the background RSS sampler."""
+        if self.enabled:
+            return
+        self.reset()
+        self.enabled = True
+        self._stop_sampler.clear()
+        self._sampler = threading.Thread(target=self._sample_rss, name='isse-rss-sampler', daemon=True)
+        self._sampler.start()
+
+    def disable(self) -> None:
+        """Stops collecting data; already collected data is kept."""
+        self.enabled = False
+        self._stop_sampler.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def reset(self) -> None:
+        """Discards all collected spans and counters."""
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+            self._open.clear()
+        self._origin = time.perf_counter()
+        self._origin_unix_s = time.time()
+
+    def _sample_rss(self) -> None:
+        while not self._stop_sampler.wait(self.sample_interval_s):
+            self._update_peaks(current_rss_bytes())
+
+    def _update_peaks(self, rss: int) -> None:
+        with self._lock:
+            for record in self._open:
+                if rss > record.peak_rss_bytes:
+                    record.peak_rss_bytes = rss
+
+    @contextlib.contextmanager
+    def _span(self, name: str, attributes: Dict[str, Any]):
+        rss = current_rss_bytes()
+        with self._lock:
+            record = SpanRecord(
+                name=name,
+                start_s=time.perf_counter() - self._origin,
+                attributes=attributes,
+                start_rss_bytes=rss,
+                peak_rss_bytes=rss,
+                depth=len(self._open),
+            )
+            self._open.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration_s = time.perf_counter() - start
+            self._update_peaks(current_rss_bytes())
+            with self._lock:
+                self._open.remove(record)
+                self.spans.append(record)
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Returns a context manager timing the enclosed block as span `name`.
+
+        Args:
+            name: Dotted span name, e.g. 'mmm.adstock'.
+            **attributes: Extra JSON-serializable labels stored with the span.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, attributes)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Adds `value` to counter `name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, trace: Dict[str, Any], **attributes: Any) -> None:
+        """
+        Adds the spans and counters of a trace collected in another process.
+
+        Span start times are shifted onto this profiler's clock; peak RSS
+        values remain those of the process that recorded the span.
+
+        Args:
+            trace: Output of `to_trace()` from the other process.
+            **attributes: Extra labels added to every merged span, e.g. the
+                pipeline stage the trace belongs to.
+        """
+        offset = trace.get('origin_unix_s', self._origin_unix_s) - self._origin_unix_s
+        with self._lock:
+            for span in trace['spans']:
+                self.spans.append(SpanRecord(
+                    name=span['name'],
+                    start_s=span['start_s'] + offset,
+                    attributes={**span['attributes'], **attributes},
+                    duration_s=span['duration_s'],
+                    start_rss_bytes=span['start_rss_bytes'],
+                    peak_rss_bytes=span['peak_rss_bytes'],
+                    depth=span['depth'],
+                ))
+            for name, value in trace['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Aggregates spans by name into call count, total/max time and peak RSS."""
+        stats: Dict[str, Dict[str, float]] = {}
+        for record in self.spans:
+            entry = stats.setdefault(
+                record.name, {'count': 0, 'total_s': 0.0, 'max_s': 0.0, 'peak_rss_bytes': 0}
+            )
+            entry['count'] += 1
+            entry['total_s'] += record.duration_s
+            entry['max_s'] = max(entry['max_s'], record.duration_s)
+            entry['peak_rss_bytes'] = max(entry['peak_rss_bytes'], record.peak_rss_bytes)
+        return stats
+
+    def to_trace(self) -> Dict[str, Any]:
+        """Returns the collected data as a JSON-serializable trace."""
+        return {
+            'origin_unix_s': self._origin_unix_s,
+            'spans': [
+                {
+                    'name': r.name,
+                    'start_s': r.start_s,
+                    'duration_s': r.duration_s,
+                    'depth': r.depth,
+                    'start_rss_bytes': r.start_rss_bytes,
+                    'peak_rss_bytes': r.peak_rss_bytes,
+                    'attributes': r.attributes,
+                }
+                for r in sorted(self.spans, key=lambda r: r.start_s)
+            ],
+            'summary': self.summary(),
+            'counters': dict(self.counters),
+        }
+
+    def to_prometheus(self) -> str:
+        """Renders span summaries and counters in the Prometheus text format."""
+        def label(value: str) -> str:
+            return value.replace('\\', '\\\\').replace('"', '\\"')
+
+        summary = self.summary()
+        lines = [
+            '# HELP isse_span_duration_seconds Wall time spent in each instrumented span.',
+            '# TYPE isse_span_duration_seconds summary',
+        ]
+        for name, entry in sorted(summary.items()):
+            lines.append(f'isse_span_duration_seconds_sum{{span="{label(name)}"}} {entry["total_s"]:.9f}')
+            lines.append(f'isse_span_duration_seconds_count{{span="{label(name)}"}} {entry["count"]}')
+        lines += [
+            '# HELP isse_span_peak_rss_bytes Peak resident set size observed during each span.',
+            '# TYPE isse_span_peak_rss_bytes gauge',
+        ]
+        for name, entry in sorted(summary.items()):
+            lines.append(f'isse_span_peak_rss_bytes{{span="{label(name)}"}} {entry["peak_rss_bytes"]}')
+        lines += [
+            '# HELP isse_events_total Instrumented event counters.',
+            '# TYPE isse_events_total counter',
+        ]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'isse_events_total{{event="{label(name)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, output_dir: Path, prefix: str = 'isse') -> Dict[str, Path]:
+        """
+        Writes `<prefix>_trace.json` and `<prefix>_metrics.prom` to `output_dir`.
+
+        Returns:
+            A dictionary mapping each output kind to the path written.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        trace_path = output_dir / f'{prefix}_trace.json'
+        metrics_path = output_dir / f'{prefix}_metrics.prom'
+        trace_path.write_text(json.dumps(self.to_trace(), indent=2, default=str))
+        metrics_path.write_text(self.to_prometheus())
+        return {'trace': trace_path, 'metrics': metrics_path}
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+# Process-wide profiler used by all instrumented modules.
+profiler = Profiler()
+
+
+def _reset_after_fork() -> None:
+    """
+    Gives forked workers a fresh, disabled profiler: the sampler thread does
+    not survive the fork and its lock may have been held at the time.
+    """
+    profiler.enabled = False
+    profiler._lock = threading.Lock()
+    profiler._stop_sampler = threading.Event()
+    profiler._sampler = None
+    profiler.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def span(name: str, **attributes: Any):
+    """Times a block on the process-wide profiler; a no-op when disabled."""
+    if not profiler.enabled:
+        return _NULL_SPAN
+    return profiler._span(name, attributes)
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Increments a counter on the process-wide profiler; a no-op when disabled."""
+    if profiler.enabled:
+        profiler.increment(name, value)
+
+
+@contextlib.contextmanager
+def code_profiler(output_path: Path, backend: str = 'cprofile'):
+    """
+    Runs the enclosed block under a statistical or deterministic profiler.
+
+    Args:
+        output_path: File to dump the profile to ('.prof' for cProfile,
+            '.html' for pyinstrument).
+        backend: Either 'cprofile' (standard library) or 'pyinstrument'
+            (optional dependency).
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if backend == 'cprofile':
+        import cProfile
+        code_prof = cProfile.Profile()
+        code_prof.enable()
+        try:
+            yield
+        finally:
+            code_prof.disable()
+            code_prof.dump_stats(str(output_path))
+    elif backend == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler as PyinstrumentProfiler
+        except ImportError as e:
+            raise RuntimeError(
+                "The 'pyinstrument' backend requires pyinstrument: pip install pyinstrument"
+            ) from e
+        code_prof = PyinstrumentProfiler()
+        code_prof.start()
+        try:
+            yield
+        finally:
+            code_prof.stop()
+            output_path.write_text(code_prof.output_html())
+    else:
+        raise ValueError(f"Unknown profiler backend '{backend}'. Use 'cprofile' or 'pyinstrument'.")
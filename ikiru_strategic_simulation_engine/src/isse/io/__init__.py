@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Data loading, schema validation and synthetic data generation for the ISSE.
+
+Public classes are resolved lazily on first attribute access, so importing
+`isse.io` does not import pandas or pandera until they are actually needed.
+"""
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'DataLoader': 'isse.io.loaders',
+    'SyntheticDataGenerator': 'isse.io.synthetic',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
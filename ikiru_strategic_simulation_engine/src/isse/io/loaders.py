@@ -11,6 +11,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional
 
+from isse import instrumentation
 from isse.io.schemas import (
     SyntheticOrdersSchema,
     SyntheticMarketingSpendSchema,
@@ -50,8 +51,11 @@ class DataLoader:
                 continue
 
             try:
-                df = self._load_single_file(file_path)
-                validated_df = schema.validate(df)
+                with instrumentation.span("io.load", dataset=key):
+                    df = self._load_single_file(file_path)
+                with instrumentation.span("io.validate", dataset=key):
+                    validated_df = schema.validate(df)
+                instrumentation.increment("io.rows_loaded", len(validated_df))
                 self.dataframes[key] = validated_df
                 logger.info(f"Successfully loaded and validated '{key}' data from {file_path.name}.")
             except Exception as e:
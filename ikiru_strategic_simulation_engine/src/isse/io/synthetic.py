@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Scalable, seeded synthetic data generator for the ISSE.
+
+Produces orders, marketing spend, B2B leads and customer/warehouse locations
+that conform to the column layout and constraints of the pandera schemas in
+`isse.io.schemas`, at any size from a handful of rows up to 1e8. Data is
+generated in fixed-size chunks, each drawn from its own seeded stream, so the
+same seed always yields the same rows whether they are held in memory or
+streamed to disk. Marketing spend is weekly, so it is capped at the
+`MAX_SPEND_WEEKS` periods that fit in pandas' timestamp range.
+
+Also produces the long-format region x category marketing panel (weekly
+spend per channel and the matching acquisitions) used by the panel MMM.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+PROJECT_TYPES = ['HNWI', 'Designer', 'Institutional', 'Developer']
+LEAD_SOURCES = ['Inbound', 'Outbound']
+CITY_CENTRES = {
+    'Mumbai': (19.0760, 72.8777),
+    'Pune': (18.5204, 73.8567),
+    'Delhi': (28.7041, 77.1025),
+    'Bengaluru': (12.9716, 77.5946),
+}
+
+# Orders fall within a three-year window. Spend is weekly on Mondays from the
+# start of that window, matching the W-MON acquisitions the MMM joins it to.
+ORDERS_START = np.datetime64('2021-01-01', 'D')
+ORDERS_WINDOW_DAYS = 3 * 365
+SPEND_START = np.datetime64('2021-01-04', 'D')
+MAX_SPEND_WEEKS = int((pd.Timestamp.max - pd.Timestamp(SPEND_START)) // pd.Timedelta(weeks=1)) + 1
+
+# Orders follow the Pareto/NBD and Gamma-Gamma models: each customer has a
+# gamma-distributed purchase rate, an exponential lifetime with a
+# gamma-distributed dropout rate, and a spend rate nu ~ Gamma(q, 1 / gamma)
+# with order values ~ Gamma(p, 1 / nu). Mean order value is p * gamma / (q - 1).
+ORDERS_PER_CUSTOMER = 4
+PURCHASE_RATE_SHAPE = 0.8
+DROPOUT_RATE_SHAPE, MEAN_DROPOUT_RATE_PER_DAY = 1.0, 1 / 730
+SPEND_SHAPE_P, SPEND_SHAPE_Q, SPEND_SCALE_GAMMA = 4.0, 4.0, 6_000.0
+
+PANEL_CHANNELS = ['social_media', 'search', 'influencer']
+PANEL_CHANNEL_SCALES = [25_000, 37_500, 20_000]
+PANEL_START = '2022-01-03'
+
+
+def _ids(prefix: str, start: int, stop: int) -> np.ndarray:
+    """Builds zero-padded string identifiers such as 'ORD000000001'."""
+    return (prefix + pd.Series(np.arange(start, stop)).astype(str).str.zfill(9)).to_numpy()
+
+
+class SyntheticDataGenerator:
+    """
+    Generates schema-conformant synthetic datasets of arbitrary size.
+    """
+    def __init__(self, seed: int = 42, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initializes the generator.
+
+        Args:
+            seed: Master seed; every dataset and chunk derives its stream from it.
+            chunk_size: Number of rows generated per chunk. Output for a given
+                seed is only reproducible for the same chunk size.
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self._builders: Dict[str, Callable[[np.random.Generator, int, int, int], pd.DataFrame]] = {
+            'orders': self._orders_chunk,
+            'marketing_spend': self._marketing_spend_chunk,
+            'b2b_pipeline': self._b2b_pipeline_chunk,
+            'customer_locations': self._customer_locations_chunk,
+            'warehouses': self._warehouses_chunk,
+        }
+
+    @property
+    def datasets(self):
+        """Names of the datasets this generator can produce."""
+        return list(self._builders)
+
+    def iter_chunks(self, dataset: str, n_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Yields a dataset of `n_rows` rows as a sequence of DataFrame chunks.
+
+        Args:
+            dataset: One of `datasets`.
+            n_rows: Total number of rows to generate.
+        """
+        if dataset not in self._builders:
+            raise ValueError(f"Unknown dataset '{dataset}'. Choose from {self.datasets}.")
+        if dataset == 'marketing_spend' and n_rows > MAX_SPEND_WEEKS:
+            raise ValueError(f"Weekly marketing spend is limited to {MAX_SPEND_WEEKS:,} rows.")
+        builder = self._builders[dataset]
+        dataset_key = self.datasets.index(dataset)
+        for chunk_index, start in enumerate(range(0, n_rows, self.chunk_size)):
+            stop = min(start + self.chunk_size, n_rows)
+            rng = np.random.default_rng([self.seed, dataset_key, chunk_index])
+            yield builder(rng, start, stop, n_rows)
+
+    def generate(self, dataset: str, n_rows: int) -> pd.DataFrame:
+        """Generates a whole dataset in memory."""
+        return pd.concat(self.iter_chunks(dataset, n_rows), ignore_index=True)
+
+    def write_csv(self, dataset: str, n_rows: int, path: Path) -> Path:
+        """
+        Streams a dataset to a CSV file without holding it all in memory.
+
+        Returns:
+            The path written to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for i, chunk in enumerate(self.iter_chunks(dataset, n_rows)):
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        return path
+
+    def write_all(self, output_dir: Path, n_rows: int) -> Dict[str, Path]:
+        """
+        Writes every dataset as `synthetic_<name>.csv` into `output_dir`.
+
+        Marketing spend is written with at most `MAX_SPEND_WEEKS` rows.
+        """
+        return {
+            name: self.write_csv(
+                name,
+                min(n_rows, MAX_SPEND_WEEKS) if name == 'marketing_spend' else n_rows,
+                Path(output_dir) / f"synthetic_{name}.csv",
+            )
+            for name in self.datasets
+        }
+
+    def marketing_panel(
+        self, n_regions: int, n_categories: int, n_weeks: int = 156
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Generates a weekly region x category marketing panel.
+
+        Each group has its own channel effects; acquisitions are Poisson
+        counts around a linear response to that week's spend.
+
+        Args:
+            n_regions: Number of regions.
+            n_categories: Number of product categories per region.
+            n_weeks: Number of weekly periods per group.
+
+        Returns:
+            A (spend_long, target_long) pair: date, region, category, channel,
+            spend_inr rows and date, region, category, acquisitions rows.
+        """
+        rng = np.random.default_rng([self.seed, len(self._builders)])
+        n_groups, n_channels = n_regions * n_categories, len(PANEL_CHANNELS)
+        spend = rng.gamma(2.0, PANEL_CHANNEL_SCALES, (n_groups, n_weeks, n_channels))
+        effects = rng.uniform(0.5, 2.0, (n_groups, 1, n_channels)) / 10_000
+        baseline = rng.uniform(5, 50, (n_groups, 1))
+        acquisitions = rng.poisson(baseline + (spend * effects).sum(axis=2))
+
+        groups = pd.MultiIndex.from_product(
+            [[f'R{r:03d}' for r in range(n_regions)], [f'C{c:03d}' for c in range(n_categories)]],
+            names=['region', 'category'],
+        ).to_frame(index=False)
+        dates = pd.date_range(PANEL_START, periods=n_weeks, freq='W-MON')
+
+        target_long = groups.loc[np.repeat(np.arange(n_groups), n_weeks)].reset_index(drop=True)
+        target_long.insert(0, 'date', np.tile(dates, n_groups))
+        target_long['acquisitions'] = acquisitions.ravel()
+
+        spend_long = target_long.drop(columns='acquisitions').loc[
+            np.repeat(np.arange(len(target_long)), n_channels)
+        ].reset_index(drop=True)
+        spend_long['channel'] = np.tile(PANEL_CHANNELS, len(target_long))
+        spend_long['spend_inr'] = np.round(spend.ravel(), 2)
+        return spend_long, target_long
+
+    def write_marketing_panel(self, output_dir: Path, n_regions: int, n_categories: int) -> Dict[str, Path]:
+        """
+        Writes `synthetic_marketing_spend_panel.csv` and
+        `synthetic_acquisitions_panel.csv` into `output_dir`.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        spend_long, target_long = self.marketing_panel(n_regions, n_categories)
+        paths = {
+            'marketing_spend_panel': output_dir / 'synthetic_marketing_spend_panel.csv',
+            'acquisitions_panel': output_dir / 'synthetic_acquisitions_panel.csv',
+        }
+        spend_long.to_csv(paths['marketing_spend_panel'], index=False)
+        target_long.to_csv(paths['acquisitions_panel'], index=False)
+        return paths
+
+    # --- Per-dataset chunk builders ---------------------------------------
+
+    def _orders_chunk(self, rng: np.random.Generator, start: int, stop: int, total: int) -> pd.DataFrame:
+        """
+        Orders: roughly four orders per customer. Each chunk draws its own
+        customers (sign-up day, purchase rate, lifetime and spend rate), shares
+        its orders among them in proportion to rate x active days, places
+        each order within its customer's active period and draws its value
+        around the customer's mean spend.
+        """
+        n = stop - start
+        first = -(-start // ORDERS_PER_CUSTOMER)
+        n_customers = max(1, -(-stop // ORDERS_PER_CUSTOMER) - first)
+        signup = rng.integers(0, ORDERS_WINDOW_DAYS, n_customers)
+        dropout_rates = rng.gamma(
+            DROPOUT_RATE_SHAPE, MEAN_DROPOUT_RATE_PER_DAY / DROPOUT_RATE_SHAPE, n_customers
+        )
+        active_days = np.minimum(rng.exponential(1 / dropout_rates), ORDERS_WINDOW_DAYS - signup)
+        weights = rng.gamma(PURCHASE_RATE_SHAPE, 1.0, n_customers) * active_days
+        spend_rates = rng.gamma(SPEND_SHAPE_Q, 1 / SPEND_SCALE_GAMMA, n_customers)
+        customers = rng.choice(n_customers, n, p=weights / weights.sum())
+        days = signup[customers] + (rng.random(n) * active_days[customers]).astype(int)
+        return pd.DataFrame({
+            'order_id': _ids('ORD', start, stop),
+            'customer_id': 'CUST' + pd.Series(first + customers).astype(str).str.zfill(9),
+            'order_date': pd.to_datetime(ORDERS_START + days.astype('timedelta64[D]')),
+            'revenue_inr': np.round(rng.gamma(SPEND_SHAPE_P, 1 / spend_rates[customers]), 2),
+        })
+
+    def _marketing_spend_chunk(self, rng: np.random.Generator, start: int, stop: int, total: int) -> pd.DataFrame:
+        """Marketing spend: one row per week with gamma-distributed channel spend."""
+        n = stop - start
+        offsets = np.arange(start, stop).astype('timedelta64[W]')
+        return pd.DataFrame({
+            'date': pd.to_datetime(SPEND_START + offsets),
+            'social_media': np.round(rng.gamma(2.0, 25_000, n), 2),
+            'search': np.round(rng.gamma(2.0, 37_500, n), 2),
+            'influencer': np.round(rng.gamma(2.0, 20_000, n), 2),
+        })
+
+    def _b2b_pipeline_chunk(self, rng: np.random.Generator, start: int, stop: int, total: int) -> pd.DataFrame:
+        """B2B leads: win probability depends on source, project type and value."""
+        n = stop - start
+        source = rng.integers(0, len(LEAD_SOURCES), n)
+        project = rng.integers(0, len(PROJECT_TYPES), n)
+        value = np.round(rng.lognormal(np.log(1_000_000), 0.8, n), 2)
+        logit = -0.5 + 0.8 * (source == 0) + 0.3 * project - 0.2 * np.log(value / 1_000_000)
+        return pd.DataFrame({
+            'lead_id': _ids('LEAD', start, stop),
+            'lead_source': np.asarray(LEAD_SOURCES)[source],
+            'project_type': np.asarray(PROJECT_TYPES)[project],
+            'potential_value_inr': value,
+            'is_won': (rng.random(n) < 1 / (1 + np.exp(-logit))).astype(int),
+        })
+
+    def _customer_locations_chunk(self, rng: np.random.Generator, start: int, stop: int, total: int) -> pd.DataFrame:
+        """Customer locations scattered around Mumbai."""
+        n = stop - start
+        lat, lon = CITY_CENTRES['Mumbai']
+        return pd.DataFrame({
+            'customer_id': _ids('CUST', start, stop),
+            'latitude': np.round(lat + rng.normal(0, 0.08, n), 6),
+            'longitude': np.round(lon + rng.normal(0, 0.06, n), 6),
+        })
+
+    def _warehouses_chunk(self, rng: np.random.Generator, start: int, stop: int, total: int) -> pd.DataFrame:
+        """Warehouses spread across the major metro areas."""
+        n = stop - start
+        city_index = rng.integers(0, len(CITY_CENTRES), n)
+        centre = np.array(list(CITY_CENTRES.values()))[city_index]
+        return pd.DataFrame({
+            'warehouse_id': _ids('WH', start, stop),
+            'city': np.asarray(list(CITY_CENTRES))[city_index],
+            'latitude': np.round(centre[:, 0] + rng.normal(0, 0.1, n), 6),
+            'longitude': np.round(centre[:, 1] + rng.normal(0, 0.1, n), 6),
+        })
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Core statistical and ML models of the ISSE.
+
+Model classes are resolved lazily on first attribute access, so importing
+`isse.models` (or one model, e.g. `FinancialSimulator`) does not pull in the
+heavy dependencies of the others (lifetimes, scikit-learn, OR-Tools).
+"""
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'D2CLTVModel': 'isse.models.d2c_ltv',
+    'MarketingMixModel': 'isse.models.d2c_mmm',
+    'PanelMarketingMixModel': 'isse.models.d2c_mmm',
+    'B2BWinProbabilityModel': 'isse.models.b2b_win_probability',
+    'LogisticsOptimizer': 'isse.models.logistics_optimization',
+    'FinancialSimulator': 'isse.models.financial_simulation',
+    'FinancialEmulator': 'isse.models.financial_emulator',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -14,6 +14,8 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from typing import Tuple
 
+from isse import instrumentation
+
 class B2BWinProbabilityModel:
     """
     A class to train a model to predict the probability of winning a B2B project.
@@ -48,8 +50,10 @@ class B2BWinProbabilityModel:
             X, y, test_size=0.2, random_state=42, stratify=y
         )
         
-        self.model_pipeline.fit(X_train, y_train)
-        accuracy = self.model_pipeline.score(X_test, y_test)
+        with instrumentation.span("b2b.fit"):
+            self.model_pipeline.fit(X_train, y_train)
+        with instrumentation.span("b2b.evaluate"):
+            accuracy = self.model_pipeline.score(X_test, y_test)
         
         return accuracy, self
 
@@ -57,7 +61,8 @@ class B2BWinProbabilityModel:
         """
         Predicts the win probability for new leads.
         """
-        probabilities = self.model_pipeline.predict_proba(new_leads_df[self.features])
+        with instrumentation.span("b2b.predict"):
+            probabilities = self.model_pipeline.predict_proba(new_leads_df[self.features])
         # Return probability of the 'won' class (class 1)
         return probabilities[:, 1]
 
@@ -9,7 +9,9 @@ required for a modern MMM, bringing it in line with our blueprint.
 import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
-from typing import Dict
+from typing import Dict, Optional, Sequence
+
+from isse import instrumentation
 
 class MarketingMixModel:
     """
@@ -39,11 +41,14 @@ class MarketingMixModel:
         """
         transformed_features = pd.DataFrame(index=self.spend_df.index)
         for channel, decay in decay_rates.items():
-            adstocked = self._apply_adstock(self.spend_df[channel], decay)
-            saturated = self._apply_saturation(adstocked, saturation_alphas[channel])
+            with instrumentation.span("mmm.adstock", channel=channel):
+                adstocked = self._apply_adstock(self.spend_df[channel], decay)
+            with instrumentation.span("mmm.saturation", channel=channel):
+                saturated = self._apply_saturation(adstocked, saturation_alphas[channel])
             transformed_features[f'{channel}_transformed'] = saturated
 
-        self.model.fit(transformed_features, self.target_series)
+        with instrumentation.span("mmm.fit"):
+            self.model.fit(transformed_features, self.target_series)
         return self
 
     def get_coefficients(self) -> Dict[str, float]:
@@ -53,3 +58,170 @@ class MarketingMixModel:
             for channel, coef in zip(self.spend_df.columns, self.model.coef_)
         }
 
+
+class PanelMarketingMixModel:
+    """
+    Fits one Marketing Mix Model per group (e.g. region x category) in a
+    single batched pass.
+
+    The long-format spend table is pivoted once into a dense
+    (groups, dates, channels) buffer. Adstock and saturation are applied to
+    that shared buffer in place for all groups at once, and every group's
+    regression is solved with batched linear algebra. Each group's result
+    matches fitting `MarketingMixModel` on that group's series alone.
+    """
+    def __init__(
+        self,
+        spend_long: pd.DataFrame,
+        target_long: pd.DataFrame,
+        group_cols: Sequence[str] = ('region', 'category'),
+        target_col: str = 'acquisitions',
+        date_col: str = 'date',
+        channel_col: str = 'channel',
+        spend_col: str = 'spend_inr',
+    ):
+        """
+        Initializes the panel model.
+
+        Args:
+            spend_long: Long-format spend with columns date, *group_cols,
+                channel and spend_inr (the layout of synthetic_marketing_spend.csv
+                plus group columns). Duplicate rows are summed.
+            target_long: Long-format target with columns date, *group_cols and
+                `target_col`. Group/date cells without a target are left out
+                of that group's regression but still carry adstock forward.
+            group_cols: Columns identifying one model in the panel.
+            target_col: Name of the target column in `target_long`.
+            date_col, channel_col, spend_col: Column names in the spend table.
+        """
+        self.spend_long = spend_long
+        self.target_long = target_long
+        self.group_cols = list(group_cols)
+        self.target_col = target_col
+        self.date_col = date_col
+        self.channel_col = channel_col
+        self.spend_col = spend_col
+        self.coefficients: Optional[pd.DataFrame] = None
+
+    def _pivot(self, channels: Sequence[str]):
+        """
+        Pivots the long tables into dense arrays in one pass.
+
+        Returns:
+            The group index, the (G, T, C) spend buffer, the (G, T) target
+            array and the (G, T) mask of observed targets.
+        """
+        spend = self.spend_long[self.spend_long[self.channel_col].isin(channels)]
+        groups = pd.MultiIndex.from_frame(
+            spend[self.group_cols].drop_duplicates().sort_values(self.group_cols)
+        )
+        dates = pd.DatetimeIndex(np.sort(pd.to_datetime(spend[self.date_col]).unique()))
+        n_groups, n_dates, n_channels = len(groups), len(dates), len(channels)
+
+        g = groups.get_indexer(pd.MultiIndex.from_frame(spend[self.group_cols]))
+        t = dates.get_indexer(pd.to_datetime(spend[self.date_col]))
+        c = pd.Index(channels).get_indexer(spend[self.channel_col])
+        flat = (g * n_dates + t) * n_channels + c
+        buffer = np.bincount(
+            flat, weights=spend[self.spend_col].to_numpy(dtype=float),
+            minlength=n_groups * n_dates * n_channels,
+        ).reshape(n_groups, n_dates, n_channels)
+
+        g = groups.get_indexer(pd.MultiIndex.from_frame(self.target_long[self.group_cols]))
+        t = dates.get_indexer(pd.to_datetime(self.target_long[self.date_col]))
+        known = (g >= 0) & (t >= 0)
+        flat = g[known] * n_dates + t[known]
+        values = self.target_long[self.target_col].to_numpy(dtype=float)[known]
+        size = n_groups * n_dates
+        target = np.bincount(flat, weights=values, minlength=size).reshape(n_groups, n_dates)
+        mask = np.bincount(flat, minlength=size).reshape(n_groups, n_dates) > 0
+        return groups, buffer, target, mask
+
+    @staticmethod
+    def _apply_adstock(buffer: np.ndarray, decays: np.ndarray) -> None:
+        """Applies geometric adstock along the date axis, in place, for all groups."""
+        for i in range(1, buffer.shape[1]):
+            buffer[:, i, :] += decays * buffer[:, i - 1, :]
+
+    @staticmethod
+    def _apply_saturation(buffer: np.ndarray, alphas: np.ndarray) -> None:
+        """Applies the Hill saturation function in place, for all groups."""
+        np.multiply(buffer, -alphas, out=buffer)
+        np.expm1(buffer, out=buffer)
+        np.negative(buffer, out=buffer)
+
+    def fit(
+        self,
+        decay_rates: Dict[str, float],
+        saturation_alphas: Dict[str, float],
+        chunk_size: int = 1024,
+    ) -> 'PanelMarketingMixModel':
+        """
+        Transforms the spend data and fits every group's regression.
+
+        Args:
+            decay_rates: Adstock decay per channel, shared by all groups.
+            saturation_alphas: Saturation alpha per channel.
+            chunk_size: Number of groups solved per batch; bounds the memory
+                used by the batched pseudo-inverse.
+
+        Returns:
+            The fitted panel model.
+        """
+        channels = list(decay_rates)
+        with instrumentation.span("mmm_panel.pivot"):
+            groups, features, target, mask = self._pivot(channels)
+        instrumentation.increment("mmm_panel.groups", len(groups))
+
+        with instrumentation.span("mmm.adstock", channels=len(channels), groups=len(groups)):
+            self._apply_adstock(features, np.array([decay_rates[c] for c in channels]))
+        with instrumentation.span("mmm.saturation", channels=len(channels), groups=len(groups)):
+            self._apply_saturation(features, np.array([saturation_alphas[c] for c in channels]))
+
+        coefs = np.empty((len(groups), len(channels)))
+        intercepts = np.empty(len(groups))
+        r2 = np.empty(len(groups))
+        with instrumentation.span("mmm_panel.fit", groups=len(groups)):
+            for start in range(0, len(groups), chunk_size):
+                batch = slice(start, start + chunk_size)
+                coefs[batch], intercepts[batch], r2[batch] = self._solve(
+                    features[batch], target[batch], mask[batch]
+                )
+
+        self.coefficients = pd.DataFrame(coefs, index=groups, columns=channels)
+        self.coefficients['intercept'] = intercepts
+        self.coefficients['r2'] = r2
+        self.coefficients['n_obs'] = mask.sum(axis=1)
+        return self
+
+    @staticmethod
+    def _solve(features: np.ndarray, target: np.ndarray, mask: np.ndarray):
+        """
+        Batched ordinary least squares with an intercept, mirroring
+        `LinearRegression`: centre on the observed rows, then take the
+        minimum-norm solution via the pseudo-inverse.
+        """
+        weights = mask.astype(float)
+        n_obs = np.maximum(weights.sum(axis=1), 1)
+        x_mean = (features * weights[:, :, None]).sum(axis=1) / n_obs[:, None]
+        y_mean = (target * weights).sum(axis=1) / n_obs
+        x = (features - x_mean[:, None, :]) * weights[:, :, None]
+        y = (target - y_mean[:, None]) * weights
+
+        coefs = (np.linalg.pinv(x) @ y[:, :, None])[:, :, 0]
+        intercepts = y_mean - (x_mean * coefs).sum(axis=1)
+        residuals = y - (x @ coefs[:, :, None])[:, :, 0]
+        ss_res = (residuals ** 2).sum(axis=1)
+        ss_tot = (y ** 2).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.nan)
+        return coefs, intercepts, r2
+
+    def get_coefficients(self) -> pd.DataFrame:
+        """
+        Returns the coefficient table: one row per group, one column per
+        channel plus 'intercept', 'r2' and 'n_obs'.
+        """
+        if self.coefficients is None:
+            raise RuntimeError("Model has not been fitted yet. Call .fit() first.")
+        return self.coefficients
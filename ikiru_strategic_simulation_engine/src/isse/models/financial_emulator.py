@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Surrogate emulator for interactive FinancialSimulator what-if queries.
+
+Runs `FinancialSimulator` offline on a Latin hypercube design over selected
+assumptions and fits a polynomial chaos expansion (total-degree Legendre
+polynomials, least squares) to the NPV mean, standard deviation and key
+percentiles. Queries inside the trained domain are answered from the
+surrogate in microseconds, together with leave-one-out error bounds; queries
+outside it fall back to a full Monte Carlo simulation.
+
+Training runs and the fallback use the same number of simulations (and the
+simulator's fixed seed), so both paths estimate the same quantity as
+`run-financial-sim`: the error bounds then only have to cover the polynomial
+fit, and answers do not jump at the edge of the trained domain.
+"""
+import copy
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from isse import instrumentation
+from isse.models.financial_simulation import FinancialSimulator
+
+# Assumptions varied by default and the domain the surrogate is trained on.
+# Nested assumptions are addressed with dotted keys, e.g. 'd2c_growth.mean'.
+# The margin bounds keep gross_margin >= op_ex_percent: the NPV spread and
+# percentiles have a kink where free cash flow changes sign, which a
+# polynomial cannot fit, so loss-making plans fall back to simulation.
+DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    'gross_margin': (0.25, 0.40),
+    'op_ex_percent': (0.15, 0.25),
+    'd2c_growth.mean': (0.00, 0.30),
+    'b2b_growth.mean': (0.00, 0.40),
+    'discount_rate': (0.08, 0.20),
+}
+
+OUTPUTS = ['npv_mean', 'npv_std', 'p5', 'p50', 'p95']
+
+
+def _check_keys(assumptions: Dict[str, Any], keys) -> None:
+    """Raises ValueError if a dotted key does not name an existing assumption value."""
+    unknown = []
+    for key in keys:
+        value = assumptions
+        for part in key.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                unknown.append(key)
+                break
+            value = value[part]
+        else:
+            if isinstance(value, dict):
+                unknown.append(key)
+    if unknown:
+        raise ValueError(f"Unknown assumption(s): {', '.join(unknown)}.")
+
+
+def _with_overrides(assumptions: Dict[str, Any], overrides: Dict[str, float]) -> Dict[str, Any]:
+    """Returns a copy of `assumptions` with dotted-key overrides applied."""
+    _check_keys(assumptions, overrides)
+    merged = copy.deepcopy(assumptions)
+    for key, value in overrides.items():
+        target = merged
+        *parents, leaf = key.split('.')
+        for parent in parents:
+            target = target[parent]
+        target[leaf] = value
+    return merged
+
+
+def _legendre_table(x: np.ndarray, degree: int) -> np.ndarray:
+    """
+    Evaluates Legendre polynomials P_0..P_degree at points scaled to [-1, 1].
+
+    Returns:
+        An array of shape (degree + 1, *x.shape).
+    """
+    table = np.empty((degree + 1,) + x.shape)
+    table[0] = 1.0
+    if degree >= 1:
+        table[1] = x
+    for k in range(1, degree):
+        table[k + 1] = ((2 * k + 1) * x * table[k] - k * table[k - 1]) / (k + 1)
+    return table
+
+
+class FinancialEmulator:
+    """
+    A polynomial chaos surrogate of `FinancialSimulator` over a box of assumptions.
+    """
+    def __init__(
+        self,
+        base_assumptions: Dict[str, Any],
+        bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        degree: int = 4,
+        n_design_points: int = 256,
+        n_simulations: int = 10000,
+        seed: int = 42,
+    ):
+        """
+        Initializes the emulator.
+
+        Args:
+            base_assumptions: Assumptions for `FinancialSimulator`; values not
+                in `bounds` stay fixed at these values.
+            bounds: (low, high) range for each emulated assumption.
+            degree: Total degree of the polynomial chaos expansion.
+            n_design_points: Number of simulator runs in the training design.
+            n_simulations: Monte Carlo iterations per training run and for
+                queries outside the trained domain. Matches the default of
+                `FinancialSimulator` so answers agree with a full run.
+            seed: Seed for the Latin hypercube design.
+        """
+        self.base_assumptions = base_assumptions
+        self.bounds = dict(bounds or DEFAULT_BOUNDS)
+        _check_keys(base_assumptions, self.bounds)
+        self.inputs = list(self.bounds)
+        self.degree = degree
+        self.n_design_points = n_design_points
+        self.n_simulations = n_simulations
+        self.seed = seed
+
+        self.exponents = np.array([
+            e for e in itertools.product(range(degree + 1), repeat=len(self.inputs))
+            if sum(e) <= degree
+        ])
+        self._low = np.array([self.bounds[k][0] for k in self.inputs])
+        self._high = np.array([self.bounds[k][1] for k in self.inputs])
+        self.coefficients: Optional[np.ndarray] = None
+        self.error_bounds: Optional[Dict[str, float]] = None
+        self.rmse: Optional[Dict[str, float]] = None
+
+    def _scale(self, points: np.ndarray) -> np.ndarray:
+        return 2 * (points - self._low) / (self._high - self._low) - 1
+
+    def _basis(self, scaled: np.ndarray) -> np.ndarray:
+        """Builds the (n_points, n_terms) design matrix of Legendre products."""
+        table = _legendre_table(scaled, self.degree)  # (degree+1, n_points, n_inputs)
+        rows = np.arange(scaled.shape[0])[None, :, None]
+        dims = np.arange(len(self.inputs))
+        return table[self.exponents[:, None, :], rows, dims].prod(axis=2).T
+
+    def design(self) -> np.ndarray:
+        """Returns a Latin hypercube design over `bounds`, one row per run."""
+        rng = np.random.default_rng(self.seed)
+        n, d = self.n_design_points, len(self.inputs)
+        strata = np.argsort(rng.random((n, d)), axis=0)
+        unit = (strata + rng.random((n, d))) / n
+        return self._low + unit * (self._high - self._low)
+
+    def _simulate(self, overrides: Dict[str, float], n_simulations: int) -> Dict[str, Any]:
+        assumptions = _with_overrides(self.base_assumptions, overrides)
+        return FinancialSimulator(assumptions, n_simulations=n_simulations).run_simulation()
+
+    def fit(self) -> 'FinancialEmulator':
+        """
+        Runs the simulator on the design and fits the surrogate.
+
+        `FinancialSimulator` reseeds on every run, so all design points share
+        the same random draws and the fitted response surface is smooth.
+
+        Returns:
+            The fitted emulator instance.
+        """
+        n_terms = len(self.exponents)
+        if self.n_design_points <= n_terms:
+            raise ValueError(
+                f"n_design_points ({self.n_design_points}) must exceed the number of "
+                f"polynomial terms ({n_terms}) for degree {self.degree}."
+            )
+
+        points = self.design()
+        targets = np.empty((len(points), len(OUTPUTS)))
+        with instrumentation.span("emulator.design_runs", points=len(points)):
+            for i, point in enumerate(points):
+                results = self._simulate(dict(zip(self.inputs, point)), self.n_simulations)
+                targets[i] = [
+                    results['npv_mean'],
+                    results['npv_std'],
+                    results['npv_percentiles']['p5'],
+                    results['npv_percentiles']['p50'],
+                    results['npv_percentiles']['p95'],
+                ]
+
+        with instrumentation.span("emulator.fit"):
+            basis = self._basis(self._scale(points))
+            self.coefficients, *_ = np.linalg.lstsq(basis, targets, rcond=None)
+            # Closed-form leave-one-out residuals: e_i / (1 - h_ii).
+            q, _ = np.linalg.qr(basis)
+            leverage = np.sum(q ** 2, axis=1)
+            loo = (targets - basis @ self.coefficients) / (1 - leverage)[:, None]
+        self.error_bounds = dict(zip(OUTPUTS, np.abs(loo).max(axis=0).tolist()))
+        self.rmse = dict(zip(OUTPUTS, np.sqrt(np.mean(loo ** 2, axis=0)).tolist()))
+        return self
+
+    def in_domain(self, overrides: Dict[str, float]) -> bool:
+        """True if every override is an emulated input within its bounds."""
+        return all(
+            key in self.bounds and self.bounds[key][0] <= value <= self.bounds[key][1]
+            for key, value in overrides.items()
+        )
+
+    def query(self, overrides: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Predicts the NPV distribution summary for a what-if scenario.
+
+        Args:
+            overrides: Dotted-key assumption values, e.g.
+                {'gross_margin': 0.3, 'd2c_growth.mean': 0.18}. Emulated
+                inputs not given take their value from the base assumptions.
+
+        Returns:
+            A dictionary shaped like `FinancialSimulator.run_simulation` output
+            (without the raw distribution), plus 'error_bounds' (maximum
+            leave-one-out absolute error per output, relative to a simulation
+            with `n_simulations` iterations, or None for a true simulation)
+            and 'source' ('emulator' or 'simulation').
+
+        Raises:
+            ValueError: If an override names an assumption that does not exist.
+        """
+        if self.coefficients is None:
+            raise RuntimeError("Emulator has not been fitted yet. Call .fit() first.")
+        overrides = overrides or {}
+        _check_keys(self.base_assumptions, overrides)
+        point = {key: self._base_value(key) for key in self.inputs}
+        point.update(overrides)
+
+        if not self.in_domain(point):
+            results = self._simulate(overrides, self.n_simulations)
+            results.pop('npv_distribution')
+            return {**results, 'error_bounds': None, 'source': 'simulation'}
+
+        x = np.array([[point[key] for key in self.inputs]])
+        mean, std, p5, p50, p95 = (self._basis(self._scale(x)) @ self.coefficients)[0]
+        return {
+            'npv_mean': mean,
+            'npv_std': std,
+            'npv_percentiles': {'p5': p5, 'p50': p50, 'p95': p95},
+            'error_bounds': self.error_bounds,
+            'source': 'emulator',
+        }
+
+    def _base_value(self, key: str) -> float:
+        value = self.base_assumptions
+        for part in key.split('.'):
+            value = value[part]
+        return value
+
+    def save(self, path: Path) -> Path:
+        """Writes the fitted emulator to a JSON file."""
+        if self.coefficients is None:
+            raise RuntimeError("Emulator has not been fitted yet. Call .fit() first.")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'base_assumptions': self.base_assumptions,
+            'bounds': self.bounds,
+            'degree': self.degree,
+            'n_design_points': self.n_design_points,
+            'n_simulations': self.n_simulations,
+            'seed': self.seed,
+            'coefficients': self.coefficients.tolist(),
+            'error_bounds': self.error_bounds,
+            'rmse': self.rmse,
+        }, indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> 'FinancialEmulator':
+        """Loads an emulator previously written with `save`."""
+        state = json.loads(Path(path).read_text())
+        emulator = cls(
+            state['base_assumptions'],
+            bounds={k: tuple(v) for k, v in state['bounds'].items()},
+            degree=state['degree'],
+            n_design_points=state['n_design_points'],
+            n_simulations=state['n_simulations'],
+            seed=state['seed'],
+        )
+        emulator.coefficients = np.array(state['coefficients'])
+        emulator.error_bounds = state['error_bounds']
+        emulator.rmse = state['rmse']
+        return emulator
@@ -9,6 +9,10 @@ distribution for key financial outcomes like NPV.
 import numpy as np
 from typing import Dict, Any
 
+from isse import instrumentation
+
+MONTE_CARLO_CHUNK_SIZE = 1_000
+
 class FinancialSimulator:
     """
     Runs a Monte Carlo simulation of Ikiru's 5-year financial plan.
@@ -39,32 +43,38 @@ class FinancialSimulator:
         
         all_npv_results = []
 
-        for _ in range(self.n_simulations):
-            # Simulate 5 years of revenue growth
-            d2c_growth_path = np.random.normal(d2c_growth_dist['mean'], d2c_growth_dist['std'], 5)
-            b2b_growth_path = np.random.normal(b2b_growth_dist['mean'], b2b_growth_dist['std'], 5)
-            
-            d2c_rev = [self.assumptions['d2c_rev_y0']]
-            b2b_rev = [self.assumptions['b2b_rev_y0']]
+        # Simulations run in chunks so progress and timing can be instrumented
+        # without touching the per-iteration random number sequence.
+        for chunk_start in range(0, self.n_simulations, MONTE_CARLO_CHUNK_SIZE):
+            chunk_size = min(MONTE_CARLO_CHUNK_SIZE, self.n_simulations - chunk_start)
+            with instrumentation.span("financial.monte_carlo_chunk", start=chunk_start, size=chunk_size):
+                for _ in range(chunk_size):
+                    # Simulate 5 years of revenue growth
+                    d2c_growth_path = np.random.normal(d2c_growth_dist['mean'], d2c_growth_dist['std'], 5)
+                    b2b_growth_path = np.random.normal(b2b_growth_dist['mean'], b2b_growth_dist['std'], 5)
+
+                    d2c_rev = [self.assumptions['d2c_rev_y0']]
+                    b2b_rev = [self.assumptions['b2b_rev_y0']]
+
+                    for i in range(5):
+                        d2c_rev.append(d2c_rev[-1] * (1 + d2c_growth_path[i]))
+                        b2b_rev.append(b2b_rev[-1] * (1 + b2b_growth_path[i]))
+
+                    total_revenue = np.array(d2c_rev) + np.array(b2b_rev)
+
+                    # Calculate FCF
+                    gross_profit = total_revenue * self.assumptions['gross_margin']
+                    op_ex = total_revenue * self.assumptions['op_ex_percent']
+                    free_cash_flow = gross_profit - op_ex
 
-            for i in range(5):
-                d2c_rev.append(d2c_rev[-1] * (1 + d2c_growth_path[i]))
-                b2b_rev.append(b2b_rev[-1] * (1 + b2b_growth_path[i]))
+                    # Calculate NPV of the 5 future years
+                    discount_rate = self.assumptions['discount_rate']
+                    npv = np.sum([
+                        fc / ((1 + discount_rate) ** (i+1)) for i, fc in enumerate(free_cash_flow[1:])
+                    ])
 
-            total_revenue = np.array(d2c_rev) + np.array(b2b_rev)
-            
-            # Calculate FCF
-            gross_profit = total_revenue * self.assumptions['gross_margin']
-            op_ex = total_revenue * self.assumptions['op_ex_percent']
-            free_cash_flow = gross_profit - op_ex
-            
-            # Calculate NPV of the 5 future years
-            discount_rate = self.assumptions['discount_rate']
-            npv = np.sum([
-                fc / ((1 + discount_rate) ** (i+1)) for i, fc in enumerate(free_cash_flow[1:])
-            ])
-            
-            all_npv_results.append(npv)
+                    all_npv_results.append(npv)
+            instrumentation.increment("financial.simulations", chunk_size)
 
         return {
             "npv_distribution": all_npv_results,
@@ -7,7 +7,9 @@ Problem (CVRP) to find the most efficient delivery routes.
 """
 from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from isse import instrumentation
 
 class LogisticsOptimizer:
     """
@@ -25,9 +27,13 @@ class LogisticsOptimizer:
         self.num_vehicles = num_vehicles
         self.num_locations = len(distance_matrix)
 
-    def solve(self) -> Dict[str, Any]:
+    def solve(self, time_limit_s: Optional[int] = None) -> Dict[str, Any]:
         """
         Solves the routing problem and returns the optimal routes.
+
+        Args:
+            time_limit_s: Optional wall-time limit for the solver, in seconds.
+                The best solution found within the limit is returned.
         
         Returns:
             A dictionary containing the total distance and the routes for each vehicle.
@@ -48,8 +54,12 @@ class LogisticsOptimizer:
         search_parameters.first_solution_strategy = (
             routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
         )
+        if time_limit_s is not None:
+            search_parameters.time_limit.seconds = time_limit_s
 
-        solution = routing.SolveWithParameters(search_parameters)
+        instrumentation.increment("logistics.locations", self.num_locations)
+        with instrumentation.span("logistics.routing", vehicles=self.num_vehicles):
+            solution = routing.SolveWithParameters(search_parameters)
 
         if solution:
             return self._format_solution(manager, routing, solution)
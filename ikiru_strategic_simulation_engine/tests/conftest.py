@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Shared pytest configuration: makes the `isse` package importable from src/,
+as `scripts/main.py` does.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
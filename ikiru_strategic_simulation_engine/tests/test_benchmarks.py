@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the benchmark suite in `scripts/run_benchmarks.py`.
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import run_benchmarks  # noqa: E402
+
+
+def test_default_suite_finishes(tmp_path):
+    output_path = tmp_path / 'results.json'
+
+    regressions = run_benchmarks.main(
+        sizes=[100], output_path=output_path, baseline_path=tmp_path / 'baseline.json', repeats=1
+    )
+
+    assert regressions == []
+    results = json.loads(output_path.read_text())['results']
+    assert sorted(r['model'] for r in results) == sorted(run_benchmarks.BENCHMARKS)
+    assert [r for r in results if 'error' in r] == []
+    assert all(r['wall_time_s'] > 0 for r in results)
+
+
+def test_failing_case_is_recorded(tmp_path, monkeypatch):
+    output_path = tmp_path / 'results.json'
+    baseline = {'results': [{'model': 'd2c_mmm', 'size': 0, 'wall_time_s': 0.1}]}
+    (tmp_path / 'baseline.json').write_text(json.dumps(baseline))
+
+    # A zero-row MMM fit raises inside the worker.
+    regressions = run_benchmarks.main(
+        models=['d2c_mmm'], sizes=[0], output_path=output_path,
+        baseline_path=tmp_path / 'baseline.json', repeats=1,
+    )
+
+    results = json.loads(output_path.read_text())['results']
+    assert len(results) == 1 and set(results[0]) == {'model', 'size', 'error'}
+    assert len(regressions) == 1 and 'failed' in regressions[0]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the vectorized BG/NBD + Gamma-Gamma CLV engine in `isse.models.d2c_ltv`.
+"""
+import numpy as np
+import pytest
+from lifetimes.datasets import load_cdnow_summary_data_with_monetary_value
+
+from isse.io.synthetic import SyntheticDataGenerator
+from isse.models.d2c_ltv import D2CLTVModel
+
+
+@pytest.fixture(scope='module')
+def fitted_model() -> D2CLTVModel:
+    """A D2CLTVModel with CLV models fitted on the CDNOW sample shipped with lifetimes."""
+    model = D2CLTVModel()
+    model.summary_data = load_cdnow_summary_data_with_monetary_value()
+    return model.fit_clv()
+
+
+def test_clv_matches_lifetimes(fitted_model):
+    summary = fitted_model.summary_data
+    expected = fitted_model.ggf.customer_lifetime_value(
+        fitted_model.bgf,
+        summary['frequency'],
+        summary['recency'],
+        summary['T'],
+        summary['monetary_value'],
+        time=12,
+        discount_rate=0.01,
+        freq='D',
+    )
+    clv = fitted_model.customer_lifetime_value(time_months=12, discount_rate=0.01)
+
+    assert clv.index.equals(summary.index)
+    np.testing.assert_allclose(clv.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_clv_float32_and_chunking(fitted_model):
+    reference = fitted_model.customer_lifetime_value()
+    chunked = fitted_model.customer_lifetime_value(dtype=np.float32, chunk_size=100)
+
+    assert chunked.dtype == np.float32
+    np.testing.assert_allclose(chunked.to_numpy(), reference.to_numpy(), rtol=1e-6)
+
+
+def test_clv_requires_fitted_models():
+    with pytest.raises(RuntimeError):
+        D2CLTVModel().customer_lifetime_value()
+
+
+def test_clv_fits_generated_orders():
+    orders = SyntheticDataGenerator(seed=3).generate('orders', 5_000)
+    model = D2CLTVModel().fit(orders).fit_clv()
+
+    assert model.ggf.params_['q'] > 1
+    clv = model.customer_lifetime_value()
+    assert clv.notna().all() and (clv > 0).all()
+    # Mean spend per order is 8,000 INR by construction.
+    expected_spend = model.ggf.conditional_expected_average_profit(
+        model.summary_data['frequency'], model.summary_data['monetary_value']
+    )
+    assert 4_000 < expected_spend.mean() < 16_000
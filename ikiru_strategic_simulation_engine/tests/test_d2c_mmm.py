@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the batched `PanelMarketingMixModel` in `isse.models.d2c_mmm`.
+"""
+import pytest
+
+from isse.io.synthetic import SyntheticDataGenerator
+from isse.models.d2c_mmm import MarketingMixModel, PanelMarketingMixModel
+
+DECAY_RATES = {'social_media': 0.5, 'search': 0.2, 'influencer': 0.6}
+SATURATION_ALPHAS = {'social_media': 1e-5, 'search': 6e-6, 'influencer': 1.2e-5}
+
+
+@pytest.fixture(scope='module')
+def panel_data():
+    return SyntheticDataGenerator(seed=7).marketing_panel(n_regions=2, n_categories=3, n_weeks=52)
+
+
+def test_panel_matches_per_group_models(panel_data):
+    spend_long, target_long = panel_data
+    coefficients = PanelMarketingMixModel(spend_long, target_long).fit(
+        DECAY_RATES, SATURATION_ALPHAS, chunk_size=4
+    ).get_coefficients()
+
+    assert len(coefficients) == 6
+    for (region, category), row in coefficients.iterrows():
+        in_group = (spend_long['region'] == region) & (spend_long['category'] == category)
+        spend_df = spend_long[in_group].pivot(index='date', columns='channel', values='spend_inr')
+        target = target_long[
+            (target_long['region'] == region) & (target_long['category'] == category)
+        ].set_index('date')['acquisitions']
+        mmm = MarketingMixModel(spend_df[list(DECAY_RATES)], target).fit(DECAY_RATES, SATURATION_ALPHAS)
+
+        for channel, coef in mmm.get_coefficients().items():
+            assert row[channel] == pytest.approx(coef, rel=1e-8)
+        assert row['intercept'] == pytest.approx(mmm.model.intercept_, rel=1e-8)
+        assert row['n_obs'] == 52
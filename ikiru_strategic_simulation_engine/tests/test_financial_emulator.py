@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the polynomial chaos surrogate in `isse.models.financial_emulator`.
+"""
+import numpy as np
+import pytest
+
+from isse.models.financial_emulator import FinancialEmulator
+from isse.models.financial_simulation import FinancialSimulator
+
+ASSUMPTIONS = {
+    'd2c_rev_y0': 52_600_000,
+    'b2b_rev_y0': 35_600_000,
+    'd2c_growth': {'mean': 0.15, 'std': 0.05},
+    'b2b_growth': {'mean': 0.20, 'std': 0.08},
+    'gross_margin': 0.28,
+    'op_ex_percent': 0.20,
+    'discount_rate': 0.12,
+}
+N_SIMULATIONS = 200
+
+
+@pytest.fixture(scope='module')
+def emulator():
+    return FinancialEmulator(
+        ASSUMPTIONS, degree=2, n_design_points=40, n_simulations=N_SIMULATIONS
+    ).fit()
+
+
+def _simulate(overrides):
+    assumptions = {k: dict(v) if isinstance(v, dict) else v for k, v in ASSUMPTIONS.items()}
+    for key, value in overrides.items():
+        if '.' in key:
+            parent, leaf = key.split('.')
+            assumptions[parent][leaf] = value
+        else:
+            assumptions[key] = value
+    return FinancialSimulator(assumptions, n_simulations=N_SIMULATIONS).run_simulation()
+
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    {'gross_margin': 0.33, 'd2c_growth.mean': 0.05},
+    {'op_ex_percent': 0.17, 'b2b_growth.mean': 0.35, 'discount_rate': 0.09},
+])
+def test_query_matches_simulation_in_domain(emulator, overrides):
+    emulated = emulator.query(overrides)
+    simulated = _simulate(overrides)
+
+    assert emulated['source'] == 'emulator'
+    bounds = emulated['error_bounds']
+    assert abs(emulated['npv_mean'] - simulated['npv_mean']) <= bounds['npv_mean']
+    assert abs(emulated['npv_std'] - simulated['npv_std']) <= bounds['npv_std']
+    for p in ('p5', 'p50', 'p95'):
+        assert abs(emulated['npv_percentiles'][p] - simulated['npv_percentiles'][p]) <= bounds[p]
+
+
+def test_query_out_of_domain_falls_back_to_simulation(emulator):
+    overrides = {'gross_margin': 0.6}
+    result = emulator.query(overrides)
+
+    assert result['source'] == 'simulation'
+    assert result['error_bounds'] is None
+    assert 'npv_distribution' not in result
+    assert result['npv_mean'] == pytest.approx(_simulate(overrides)['npv_mean'])
+
+
+@pytest.mark.parametrize('key', ['gross_marign', 'd2c_growth', 'd2c_growth.median'])
+def test_query_rejects_unknown_keys(emulator, key):
+    with pytest.raises(ValueError, match='Unknown assumption'):
+        emulator.query({key: 0.2})
+
+
+def test_bounds_reject_unknown_keys():
+    with pytest.raises(ValueError, match='Unknown assumption'):
+        FinancialEmulator(ASSUMPTIONS, bounds={'d2c_growth': (0.0, 0.3)})
+
+
+def test_save_load_round_trip(emulator, tmp_path):
+    loaded = FinancialEmulator.load(emulator.save(tmp_path / 'emulator.json'))
+
+    np.testing.assert_allclose(loaded.coefficients, emulator.coefficients)
+    assert loaded.error_bounds == emulator.error_bounds
+    assert loaded.bounds == emulator.bounds
+    overrides = {'gross_margin': 0.31, 'discount_rate': 0.15}
+    original, reloaded = emulator.query(overrides), loaded.query(overrides)
+    assert reloaded['source'] == 'emulator'
+    assert reloaded['npv_mean'] == pytest.approx(original['npv_mean'])
+    assert reloaded['npv_percentiles'] == pytest.approx(original['npv_percentiles'])
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the incremental stage runner in `scripts/pipeline.py`, using stub
+stage modules written under a temporary project root.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from pipeline import PipelineRunner, Stage  # noqa: E402
+
+STUB_TEMPLATE = '''\
+from pathlib import Path
+
+def main():
+    with open("run.log", "a") as log:
+        log.write("{name}\\n")
+    if {fail}:
+        raise RuntimeError("stub failure")
+    for output in {writes!r}:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text("{name}")
+'''
+
+
+def make_stage(root, name, depends_on=(), outputs=None, writes=None, fail=False):
+    """Writes a stub stage module under `root` and returns its `Stage`."""
+    module = f"stub_{name}_{root.name}".replace('-', '_')
+    outputs = (f"out/{name}.txt",) if outputs is None else outputs
+    writes = list(outputs) if writes is None else writes
+    scripts = root / 'scripts'
+    scripts.mkdir(exist_ok=True)
+    (scripts / f"{module}.py").write_text(STUB_TEMPLATE.format(name=name, fail=fail, writes=writes))
+    return Stage(
+        name=name,
+        module=module,
+        depends_on=tuple(depends_on),
+        code=(f"scripts/{module}.py",),
+        outputs=tuple(outputs),
+    )
+
+
+def runner(root, stages):
+    return PipelineRunner(stages, state_path=root / 'state.json', max_workers=2, root=root)
+
+
+def run_log(root):
+    path = root / 'run.log'
+    return path.read_text().split() if path.exists() else []
+
+
+@pytest.fixture
+def chain(tmp_path):
+    return [
+        make_stage(tmp_path, 'a'),
+        make_stage(tmp_path, 'b', depends_on=['a']),
+        make_stage(tmp_path, 'c', depends_on=['a']),
+        make_stage(tmp_path, 'd', depends_on=['b', 'c']),
+    ]
+
+
+def test_topological_order(tmp_path, chain):
+    order = runner(tmp_path, chain)._topological_order()
+
+    assert sorted(order) == ['a', 'b', 'c', 'd']
+    for stage in chain:
+        for dep in stage.depends_on:
+            assert order.index(dep) < order.index(stage.name)
+
+
+def test_cycle_and_unknown_dependency_rejected(tmp_path):
+    with pytest.raises(ValueError, match='Cycle'):
+        runner(tmp_path, [
+            make_stage(tmp_path, 'a', depends_on=['b']),
+            make_stage(tmp_path, 'b', depends_on=['a']),
+        ])
+    with pytest.raises(ValueError):
+        runner(tmp_path, [make_stage(tmp_path, 'a', depends_on=['missing'])])
+
+
+def test_unchanged_stages_are_skipped(tmp_path, chain):
+    assert set(runner(tmp_path, chain).run().values()) == {'ran'}
+    assert sorted(run_log(tmp_path)) == ['a', 'b', 'c', 'd']
+    assert run_log(tmp_path).index('a') < run_log(tmp_path).index('b')
+
+    assert set(runner(tmp_path, chain).run().values()) == {'skipped'}
+    assert len(run_log(tmp_path)) == 4
+
+
+def test_state_persisted(tmp_path, chain):
+    runner(tmp_path, chain).run()
+
+    state = json.loads((tmp_path / 'state.json').read_text())
+    assert sorted(state) == ['a', 'b', 'c', 'd']
+    assert all(set(entry) == {'fingerprint', 'outputs'} for entry in state.values())
+
+    # A changed stage invalidates its own entry and its downstream stages only.
+    (tmp_path / 'scripts' / f"{chain[1].module}.py").write_text(
+        STUB_TEMPLATE.format(name='b', fail=False, writes=['out/b.txt']) + '\n# edited\n'
+    )
+    status = runner(tmp_path, chain).run()
+    assert status == {'a': 'skipped', 'b': 'ran', 'c': 'skipped', 'd': 'ran'}
+
+
+def test_missing_output_reruns_stage(tmp_path, chain):
+    runner(tmp_path, chain).run()
+    (tmp_path / 'out' / 'a.txt').unlink()
+
+    status = runner(tmp_path, chain).run()
+
+    assert status['a'] == 'ran'
+    assert (tmp_path / 'out' / 'a.txt').exists()
+
+
+def test_failure_blocks_downstream(tmp_path):
+    stages = [
+        make_stage(tmp_path, 'a', fail=True),
+        make_stage(tmp_path, 'b', depends_on=['a']),
+        make_stage(tmp_path, 'c'),
+    ]
+
+    status = runner(tmp_path, stages).run()
+
+    assert status == {'a': 'failed', 'b': 'blocked', 'c': 'ran'}
+    assert 'b' not in run_log(tmp_path)
+    assert sorted(json.loads((tmp_path / 'state.json').read_text())) == ['c']
+
+
+def test_stage_without_outputs_fails(tmp_path):
+    stages = [
+        make_stage(tmp_path, 'a', writes=[]),
+        make_stage(tmp_path, 'b', depends_on=['a']),
+    ]
+
+    status = runner(tmp_path, stages).run()
+
+    assert status == {'a': 'failed', 'b': 'blocked'}